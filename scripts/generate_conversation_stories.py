@@ -16,16 +16,24 @@ Uses Google News RSS for story candidates, Claude for adaptation.
 import os
 import sys
 import json
+import time
+import hashlib
+import orjson
 import requests
 import xml.etree.ElementTree as ET
 import html
 import re
 import io
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from pathlib import Path
 import anthropic
 from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Optional: pydub for audio concatenation (fallback to simple concatenation if not available)
 try:
@@ -35,11 +43,45 @@ except ImportError:
     HAS_PYDUB = False
     print("  ⚠ pydub not installed - podcast audio will be concatenated without crossfades")
 
+# Matches HTML tags and entities together so descriptions are cleaned in a
+# single scan: tags are dropped, entities decoded in place
+_CLEAN_RE = re.compile(r'<[^>]+>|&(?:#\d+|#x[0-9a-fA-F]+|[a-zA-Z]+);')
+
+
+def _clean_description(text: str) -> str:
+    """Strip tags and decode entities from an RSS description in one pass."""
+    return _CLEAN_RE.sub(
+        lambda m: '' if m.group().startswith('<') else html.unescape(m.group()),
+        text)
+
+# Extracts the body of a ```json ...``` fence from a Claude reply in one
+# pass; handles responses with no fence uniformly
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL)
+
+# Matches one speaker line of a podcast script, e.g. "LAURA: ¡Hola!".
+# The dialogue must start with a non-space character so a bare
+# "LAURA:  " line is dropped rather than becoming an empty TTS request
+_SPEAKER_RE = re.compile(r'^(LAURA|CARLOS):[ \t]*(\S.*?)\s*$', re.MULTILINE)
+
+# Shared HTTP session - keep-alive + connection pooling across the parallel
+# RSS fetches so workers reuse the same TLS connection to news.google.com
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
 # Configuration
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 OUTPUT_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'conversation-stories-index.json')
+STORY_CACHE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'claude_story_cache.json')
+STORY_CACHE_TTL = 6 * 3600  # seconds - headlines barely move within this window
+RSS_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+RSS_CACHE_TTL = 3600  # seconds - when:1d feeds barely change within an hour
 AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'audio', 'conversation-stories')
+TTS_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'audio', '.tts_cache')
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/gramnegrod/spanish-news-pdfs/main"
 
 # Category configuration with emoji and gradient
@@ -80,6 +122,12 @@ Sound like a friend who always has something interesting to add.
 Speak clearly and slightly slower than normal conversation speed."""
 }
 
+# Speaker -> (TTS voice, instructions), resolved once instead of per line
+SPEAKER_CONFIG = {
+    "LAURA": ("nova", VOICE_INSTRUCTIONS["LAURA"]),
+    "CARLOS": ("onyx", VOICE_INSTRUCTIONS["CARLOS"]),
+}
+
 # Category to filename slug mapping
 CATEGORY_SLUGS = {
     "Tecnología": "tech",
@@ -91,87 +139,98 @@ CATEGORY_SLUGS = {
 }
 
 
-def fetch_rss_candidates() -> Dict[str, List[Dict]]:
-    """Fetch news candidates from Google News RSS for each category."""
-    candidates = {}
+def _fetch_one_category(cat: Dict) -> Tuple[str, List[Dict]]:
+    """Fetch and parse the Google News RSS feed for a single category."""
+    category = cat["name"]
+    query = cat["query"]
+    feed_url = f"https://news.google.com/rss/search?q={query}+when:1d&hl=en-US&gl=US&ceid=US:en"
 
-    for cat in CATEGORIES:
-        category = cat["name"]
-        query = cat["query"]
-        feed_url = f"https://news.google.com/rss/search?q={query}+when:1d&hl=en-US&gl=US&ceid=US:en"
+    items_found = []
 
-        candidates[category] = []
+    try:
+        response = _SESSION.get(feed_url, timeout=15, headers={
+            'User-Agent': 'Mozilla/5.0 (compatible; SpanishNewsBot/1.0)'
+        })
+        response.raise_for_status()
 
-        try:
-            response = requests.get(feed_url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; SpanishNewsBot/1.0)'
-            })
-            response.raise_for_status()
+        # Stream-parse the feed and stop after 5 items rather than
+        # materializing the full DOM just to slice the head of it
+        items = (elem for _, elem in ET.iterparse(io.BytesIO(response.content), events=('end',))
+                 if elem.tag == 'item')
+        for elem in islice(items, 5):  # Get up to 5 per category
+            title = elem.find('title')
+            description = elem.find('description')
+            source = elem.find('source')
 
-            root = ET.fromstring(response.content)
-            items = root.findall('.//item')
+            title_text = html.unescape(title.text) if title is not None and title.text else ""
 
-            for item in items[:5]:  # Get up to 5 per category
-                title = item.find('title')
-                description = item.find('description')
-                source = item.find('source')
+            desc_text = ""
+            if description is not None and description.text:
+                desc_text = _clean_description(description.text)
 
-                title_text = html.unescape(title.text) if title is not None and title.text else ""
+            source_text = source.text if source is not None and source.text else "News"
 
-                desc_text = ""
-                if description is not None and description.text:
-                    desc_text = html.unescape(description.text)
-                    desc_text = re.sub(r'<[^>]+>', '', desc_text)
+            if title_text:
+                items_found.append({
+                    "title": title_text,
+                    "description": desc_text,
+                    "source": source_text
+                })
 
-                source_text = source.text if source is not None and source.text else "News"
+            elem.clear()
 
-                if title_text:
-                    candidates[category].append({
-                        "title": title_text,
-                        "description": desc_text,
-                        "source": source_text
-                    })
+        print(f"  ✓ {category}: {len(items_found)} candidates")
 
-            print(f"  ✓ {category}: {len(candidates[category])} candidates")
+    except Exception as e:
+        print(f"  ✗ {category}: RSS error - {e}")
 
-        except Exception as e:
-            print(f"  ✗ {category}: RSS error - {e}")
+    return category, items_found
 
-    return candidates
 
+def fetch_rss_candidates() -> Dict[str, List[Dict]]:
+    """Fetch news candidates from Google News RSS for each category (in parallel).
 
-def generate_stories_with_claude(candidates: Dict[str, List[Dict]]) -> List[Dict]:
-    """Use Claude to select and adapt stories for each category/difficulty."""
+    Candidates are persisted per clock hour so repeat runs within the
+    window skip all six HTTP fetches.
+    """
+    cache_path = os.path.join(
+        RSS_CACHE_DIR, f"rss_candidates_{datetime.now():%Y%m%d_%H}.json")
 
-    if not ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < RSS_CACHE_TTL:
+        try:
+            candidates = json.loads(Path(cache_path).read_text(encoding='utf-8'))
+            print(f"  ✓ Reusing RSS candidates from {os.path.basename(cache_path)}")
+            return candidates
+        except (OSError, json.JSONDecodeError):
+            pass
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    with ThreadPoolExecutor(max_workers=len(CATEGORIES)) as executor:
+        results = list(executor.map(_fetch_one_category, CATEGORIES))
 
-    # Build prompt with all candidates
-    prompt = """You are creating Spanish conversation stories for language learners.
+    candidates = dict(results)
 
-For each category below, select the best news story and adapt it to Spanish at the specified CEFR level.
+    try:
+        os.makedirs(RSS_CACHE_DIR, exist_ok=True)
+        # Drop stale hour files before writing the current one
+        for name in os.listdir(RSS_CACHE_DIR):
+            if name.startswith('rss_candidates_') and os.path.join(RSS_CACHE_DIR, name) != cache_path:
+                os.remove(os.path.join(RSS_CACHE_DIR, name))
+        Path(cache_path).write_text(
+            json.dumps(candidates, ensure_ascii=False), encoding='utf-8')
+    except OSError as e:
+        print(f"  ⚠ Could not cache RSS candidates: {e}")
 
-NEWS CANDIDATES BY CATEGORY:
-"""
+    return candidates
 
-    for cat in CATEGORIES:
-        category = cat["name"]
-        difficulty = DIFFICULTY_MAP[category]
-        prompt += f"\n## {category} (Target: {difficulty} level)\n"
 
-        if category in candidates and candidates[category]:
-            for i, item in enumerate(candidates[category], 1):
-                prompt += f"{i}. [{item['source']}] {item['title']}\n"
-                if item['description']:
-                    prompt += f"   {item['description'][:150]}...\n"
-        else:
-            prompt += "No candidates available - create a realistic story about this topic.\n"
+# Static portion of the story-generation prompt. Kept as one module-level
+# constant so it is byte-identical across runs and can be marked with
+# cache_control - Anthropic bills the cached prefix at ~10% of input cost.
+STORY_PROMPT_INSTRUCTIONS = """You are creating Spanish conversation stories for language learners.
 
-    prompt += """
+For the category in the news candidates below, select the best news story and adapt it to Spanish at the specified CEFR level.
 
-OUTPUT FORMAT - Return valid JSON with exactly 6 stories:
+OUTPUT FORMAT - Return valid JSON with exactly 1 story:
 
 {
   "stories": [
@@ -218,33 +277,169 @@ B2 (Medio Ambiente, Gastronomía):
 - Conditional and hypothetical structures
 
 REQUIREMENTS:
-1. Each story must have exactly 4 vocabulary words
+1. The story must have exactly 4 vocabulary words
 2. Vocabulary should be words that actually appear in the story
-3. Use today's date in the id field: """ + datetime.now().strftime("%Y%m%d") + """
-4. Stories must be based on the actual news when available
+3. Use the date given below in the id field
+4. The story must be based on the actual news when available
 5. Include specific names, numbers, and facts
 
 Return ONLY the JSON, no other text."""
 
-    print("\n  Calling Claude API for story generation...")
+
+def _story_cache_key(candidates: Dict[str, List[Dict]]) -> str:
+    """Stable hash of the candidate headlines - same news means same stories."""
+    titles = {cat: [c['title'] for c in candidates[cat]] for cat in sorted(candidates)}
+    return hashlib.sha256(json.dumps(titles, ensure_ascii=False).encode()).hexdigest()
+
+
+def _story_cache_get(key: str) -> List[Dict]:
+    """Return cached stories for this candidate set, or None on miss/expiry."""
+    try:
+        with open(STORY_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        entry = cache.get(key)
+        if entry and time.time() - entry.get('cached_at', 0) < STORY_CACHE_TTL:
+            return entry['stories']
+    except (OSError, json.JSONDecodeError):
+        pass
+    return None
+
+
+def _story_cache_put(key: str, stories: List[Dict]):
+    """Persist stories for this candidate set, dropping expired entries."""
+    cache = {}
+    try:
+        with open(STORY_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    now = time.time()
+    cache = {k: v for k, v in cache.items() if now - v.get('cached_at', 0) < STORY_CACHE_TTL}
+    cache[key] = {"cached_at": now, "stories": stories}
+
+    os.makedirs(os.path.dirname(STORY_CACHE_FILE), exist_ok=True)
+    with open(STORY_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+
+def generate_stories_with_claude(candidates: Dict[str, List[Dict]]) -> List[Dict]:
+    """Use Claude to select and adapt stories for each category/difficulty."""
+
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+
+    # Re-runs with the same headlines produce the same lesson - skip the
+    # API call entirely when the candidate set was seen recently
+    cache_key = _story_cache_key(candidates)
+    cached = _story_cache_get(cache_key)
+    if cached is not None:
+        print("  ✓ Using cached stories (candidate set unchanged)")
+        return cached
+
+    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=5, timeout=120.0)
+
+    print("\n  Calling Claude API for story generation (one call per category)...")
+
+    # One small call per category instead of a single 6-story mega-prompt:
+    # shorter outputs cut tail latency, a bad category degrades gracefully,
+    # and the shared static prefix hits the prompt cache on the other calls
+    with ThreadPoolExecutor(max_workers=len(CATEGORIES)) as executor:
+        futures = {
+            executor.submit(_generate_one_category, client, cat, candidates.get(cat["name"], [])): cat["name"]
+            for cat in CATEGORIES
+        }
+        results = {}
+        for future in as_completed(futures):
+            category = futures[future]
+            try:
+                results[category] = future.result()
+            except Exception as e:
+                print(f"    ✗ {category}: generation error - {e}")
+
+    # Preserve the canonical category order
+    stories = [results[cat["name"]] for cat in CATEGORIES
+               if results.get(cat["name"]) is not None]
+
+    # Only cache complete sets: a partial result cached after one failed
+    # category would make every rerun inside the TTL replay the hole
+    # instead of retrying the missing call
+    if len(stories) == len(CATEGORIES):
+        _story_cache_put(cache_key, stories)
+    return stories
+
+
+def _generate_one_category(client, cat: Dict, cat_candidates: List[Dict]) -> Dict:
+    """Generate the adapted story for a single category via its own Claude call."""
+    category = cat["name"]
+    difficulty = DIFFICULTY_MAP[category]
+
+    parts = [f"\nNEWS CANDIDATES:\n\n## {category} (Target: {difficulty} level)\n"]
+    if cat_candidates:
+        for i, item in enumerate(cat_candidates, 1):
+            parts.append(f"{i}. [{item['source']}] {item['title']}\n")
+            if item['description']:
+                parts.append(f"   {item['description'][:150]}...\n")
+    else:
+        parts.append("No candidates available - create a realistic story about this topic.\n")
+
+    parts.append(f"\nToday's date for id fields: {datetime.now().strftime('%Y%m%d')}\n")
+    dynamic = "".join(parts)
 
     response = client.messages.create(
         model="claude-haiku-4-5-20251001",
-        max_tokens=6000,
-        messages=[{"role": "user", "content": prompt}]
+        max_tokens=1200,
+        messages=[{
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": STORY_PROMPT_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {"type": "text", "text": dynamic}
+            ]
+        }]
     )
 
     response_text = response.content[0].text
 
     # Clean up JSON
-    if "```" in response_text:
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-    response_text = response_text.strip()
+    m = _FENCE_RE.search(response_text)
+    response_text = m.group(1).strip() if m else response_text.strip()
+
+    result = orjson.loads(response_text)
+    stories = result.get("stories", [])
+    return stories[0] if stories else None
 
-    result = json.loads(response_text)
-    return result.get("stories", [])
+
+def _cached_tts(client: OpenAI, model: str, voice: str, text: str, instructions: str) -> bytes:
+    """Synthesize speech, reusing a content-addressed on-disk MP3 cache.
+
+    OpenAI TTS output is deterministic for identical input, so re-runs of
+    the pipeline (the common case during development and retries) hit the
+    cache instead of paying the API call again.
+    """
+    key = hashlib.sha256(f"{model}|{voice}|{instructions}|{text}".encode()).hexdigest()
+    cache_path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return f.read()
+
+    response = client.audio.speech.create(
+        model=model,
+        voice=voice,
+        input=text,
+        instructions=instructions
+    )
+    audio_bytes = response.content
+
+    os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        f.write(audio_bytes)
+
+    return audio_bytes
 
 
 def generate_tts_audio(stories: List[Dict], date_str: str) -> List[Dict]:
@@ -254,7 +449,7 @@ def generate_tts_audio(stories: List[Dict], date_str: str) -> List[Dict]:
         print("  ⚠ OPENAI_API_KEY not set - skipping TTS generation")
         return stories
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = OpenAI(api_key=OPENAI_API_KEY, max_retries=5, timeout=60.0)
 
     # Create date-specific audio directory
     audio_date_dir = os.path.join(AUDIO_DIR, date_str)
@@ -270,7 +465,7 @@ def generate_tts_audio(stories: List[Dict], date_str: str) -> List[Dict]:
         "Gastronomía": "gastronomy"
     }
 
-    for story in stories:
+    def _tts_one(story: Dict) -> str:
         category = story.get("category", "unknown")
         slug = category_slugs.get(category, "story")
         filename = f"{slug}.mp3"
@@ -278,23 +473,31 @@ def generate_tts_audio(stories: List[Dict], date_str: str) -> List[Dict]:
 
         try:
             # Generate TTS for the Spanish body text with Mexican accent
-            response = client.audio.speech.create(
+            audio_bytes = _cached_tts(
+                client,
                 model="gpt-4o-mini-tts-2025-12-15",
                 voice="coral",
-                input=story["body_es"],
+                text=story["body_es"],
                 instructions="Speak with a natural Mexican Spanish accent. Use clear pronunciation at a moderate pace suitable for Spanish language learners. Warm and friendly tone."
             )
 
             # Save the audio file
-            response.stream_to_file(filepath)
+            with open(filepath, 'wb') as f:
+                f.write(audio_bytes)
 
             # Update story with audio URL
             story["audio_url"] = f"{GITHUB_RAW_BASE}/audio/conversation-stories/{date_str}/{filename}"
-            print(f"    ✓ {category}: {filename}")
+            return f"    ✓ {category}: {filename}"
 
         except Exception as e:
-            print(f"    ✗ {category}: TTS error - {e}")
             story["audio_url"] = ""
+            return f"    ✗ {category}: TTS error - {e}"
+
+    # TTS calls are independent network I/O - run them concurrently
+    with ThreadPoolExecutor(max_workers=min(6, len(stories)) or 1) as executor:
+        futures = [executor.submit(_tts_one, story) for story in stories]
+        for future in as_completed(futures):
+            print(future.result())
 
     return stories
 
@@ -343,18 +546,52 @@ Keep it ~150-180 words total. 8-12 exchanges. End on a fun note."""
 
 def parse_podcast_script(script: str) -> List[Dict]:
     """Parse a podcast script into speaker lines."""
-    lines = []
-    for line in script.strip().split('\n'):
-        line = line.strip()
-        if line.startswith('LAURA:'):
-            text = line[6:].strip()
-            if text:
-                lines.append({"speaker": "LAURA", "text": text})
-        elif line.startswith('CARLOS:'):
-            text = line[7:].strip()
-            if text:
-                lines.append({"speaker": "CARLOS", "text": text})
-    return lines
+    return [{"speaker": m.group(1), "text": m.group(2)}
+            for m in _SPEAKER_RE.finditer(script)]
+
+
+def _combine_with_ffmpeg(segments: List[bytes], output_path: str) -> bool:
+    """Concatenate MP3 segments with FFmpeg's concat demuxer (no re-encode).
+
+    All TTS segments come from the same model with identical codec
+    parameters, so stream-copy concatenation is safe and avoids a full
+    decode/re-encode round trip per dialogue line. A 300ms silence file
+    (encoded once, matching the TTS output format) is inserted between
+    speakers to keep the pacing of the pydub path.
+    """
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="podcast_concat_") as tmpdir:
+        seg_paths = []
+        for i, segment_data in enumerate(segments):
+            seg_path = os.path.join(tmpdir, f"seg_{i}.mp3")
+            with open(seg_path, 'wb') as f:
+                f.write(segment_data)
+            seg_paths.append(seg_path)
+
+        # Generate the inter-speaker silence once (24kHz mono matches OpenAI TTS)
+        silence_path = os.path.join(tmpdir, "silence.mp3")
+        silence_cmd = [
+            'ffmpeg', '-y', '-f', 'lavfi', '-i', 'anullsrc=r=24000:cl=mono',
+            '-t', '0.3', '-q:a', '9', silence_path
+        ]
+        result = subprocess.run(silence_cmd, capture_output=True)
+        use_silence = result.returncode == 0
+
+        concat_list = os.path.join(tmpdir, "concat.txt")
+        with open(concat_list, 'w') as f:
+            for i, seg_path in enumerate(seg_paths):
+                f.write(f"file '{seg_path}'\n")
+                if use_silence and i < len(seg_paths) - 1:
+                    f.write(f"file '{silence_path}'\n")
+
+        concat_cmd = [
+            'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
+            '-i', concat_list, '-c', 'copy', output_path
+        ]
+        result = subprocess.run(concat_cmd, capture_output=True)
+        return result.returncode == 0 and os.path.exists(output_path)
 
 
 def combine_audio_segments(segments: List[bytes], output_path: str) -> bool:
@@ -362,18 +599,21 @@ def combine_audio_segments(segments: List[bytes], output_path: str) -> bool:
     if not segments:
         return False
 
+    # Prefer FFmpeg stream-copy concat (no decode/re-encode per segment)
+    try:
+        if _combine_with_ffmpeg(segments, output_path):
+            return True
+    except Exception as e:
+        print(f"      FFmpeg concat unavailable ({e}), falling back")
+
     try:
         if HAS_PYDUB:
-            # Use pydub for proper audio concatenation with small gaps
-            combined = AudioSegment.empty()
+            # Use pydub for proper audio concatenation with small gaps.
+            # Decode everything first, then join in one reduce pass rather
+            # than growing the combined buffer append-by-append.
             silence = AudioSegment.silent(duration=300)  # 300ms pause between speakers
-
-            for i, segment_data in enumerate(segments):
-                segment = AudioSegment.from_mp3(io.BytesIO(segment_data))
-                combined += segment
-                if i < len(segments) - 1:
-                    combined += silence
-
+            decoded = [AudioSegment.from_mp3(io.BytesIO(s)) for s in segments]
+            combined = functools.reduce(lambda a, b: a + silence + b, decoded)
             combined.export(output_path, format="mp3")
         else:
             # Simple concatenation fallback (works but no gaps)
@@ -394,7 +634,7 @@ def generate_podcast_audio(stories: List[Dict], date_str: str) -> List[Dict]:
         print("  ⚠ Skipping podcast generation - no API key")
         return stories
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = OpenAI(api_key=OPENAI_API_KEY, max_retries=5, timeout=60.0)
     audio_date_dir = os.path.join(AUDIO_DIR, date_str)
     Path(audio_date_dir).mkdir(parents=True, exist_ok=True)
 
@@ -420,23 +660,32 @@ def generate_podcast_audio(stories: List[Dict], date_str: str) -> List[Dict]:
 
         print(f"      Script: {len(lines)} exchanges")
 
-        # 3. Generate audio for each line
-        segments = []
-        for i, line in enumerate(lines):
-            voice = "nova" if line["speaker"] == "LAURA" else "onyx"
-            instruction = VOICE_INSTRUCTIONS[line["speaker"]]
-
-            try:
-                response = client.audio.speech.create(
+        # 3. Generate audio for each line - the lines are independent, so
+        # synthesize them concurrently and keep order via indexed slots
+        slots = [None] * len(lines)
+        with ThreadPoolExecutor(max_workers=min(8, len(lines))) as executor:
+            futures = {}
+            for i, line in enumerate(lines):
+                voice, instruction = SPEAKER_CONFIG[line["speaker"]]
+                future = executor.submit(
+                    _cached_tts,
+                    client,
                     model="gpt-4o-mini-tts-2025-12-15",
                     voice=voice,
-                    input=line["text"],
+                    text=line["text"],
                     instructions=instruction
                 )
-                segments.append(response.content)
-            except Exception as e:
-                print(f"      ✗ TTS error for line {i}: {e}")
-                # Continue with partial audio if some lines fail
+                futures[future] = i
+
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    slots[i] = future.result()
+                except Exception as e:
+                    print(f"      ✗ TTS error for line {i}: {e}")
+                    # Continue with partial audio if some lines fail
+
+        segments = [s for s in slots if s is not None]
 
         if len(segments) < len(lines) // 2:
             print(f"      ✗ Too many TTS failures")
@@ -473,20 +722,28 @@ def generate_conversation_stories():
     # 2. Generate stories with Claude
     print("\n[2/5] Generating stories with Claude...")
     stories = generate_stories_with_claude(candidates)
+    if not stories:
+        # Every category call failed (API outage, bad key, ...) - bail
+        # before touching the app-consumed index instead of overwriting
+        # it with an empty story list
+        print("\n  ✗ No stories generated - leaving existing index untouched")
+        sys.exit(1)
     print(f"  Generated {len(stories)} stories")
 
     for story in stories:
         print(f"    - {story['category']} ({story['difficulty']}): {story['headline_es'][:40]}...")
 
-    # 3. Generate single-voice TTS audio
+    # 3+4. Generate single-voice TTS and two-host podcasts. The two phases
+    # are independent (they touch different story fields), so they run
+    # concurrently instead of back-to-back.
     today = datetime.now()
     date_str = today.strftime("%Y-%m-%d")
-    print("\n[3/5] Generating single-voice TTS audio...")
-    stories = generate_tts_audio(stories, date_str)
-
-    # 4. Generate two-host podcast audio for selected categories
-    print("\n[4/5] Generating two-host podcast audio...")
-    stories = generate_podcast_audio(stories, date_str)
+    print("\n[3/5 + 4/5] Generating single-voice TTS and podcast audio in parallel...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tts_future = executor.submit(generate_tts_audio, stories, date_str)
+        podcast_future = executor.submit(generate_podcast_audio, stories, date_str)
+        tts_future.result()
+        podcast_future.result()
 
     # 5. Save to JSON
     print("\n[5/5] Saving to conversation-stories-index.json...")
@@ -501,8 +758,11 @@ def generate_conversation_stories():
         "generated_by": "GitHub Actions + Anthropic API"
     }
 
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # orjson serializes the Spanish UTF-8 payload ~5-10x faster than stdlib
+    # json and writes as one bytes blob. Compact output by default - the
+    # index is consumed by an app, not humans; set PRETTY_JSON to indent.
+    option = orjson.OPT_INDENT_2 if os.environ.get('PRETTY_JSON') else 0
+    Path(OUTPUT_FILE).write_bytes(orjson.dumps(output, option=option))
 
     print(f"  Saved to {OUTPUT_FILE}")
 
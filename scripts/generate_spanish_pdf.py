@@ -11,17 +11,33 @@ Generates daily Spanish learning PDFs automatically:
 """
 
 import os
+import re
 import sys
-import json
+import time
+import hashlib
+import sqlite3
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
-import anthropic
-
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 # Add the scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from pdf_builder import SpanishLearningPDF, fetch_unsplash_image
+# pdf_builder drags in the whole reportlab (and optionally PIL) stack, so it
+# is imported inside generate_daily_pdf - the fresh-PDF short-circuit and
+# early failures never pay for it
+
+# Optional: lxml's libxml2-backed parser is 2-5x faster than stdlib
+# ElementTree on the RSS feeds (fallback to stdlib if not installed)
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 
 # =============================================================================
@@ -31,22 +47,126 @@ ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 UNSPLASH_API_KEY = os.environ.get('UNSPLASH_ACCESS_KEY')
 # Note: News fetching uses Google News RSS - no API key needed
 
-OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'pdfs')
-INDEX_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'index.json')
+# Strips embedded HTML from RSS descriptions - compiled once, not per item
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Slices the first {...} block out of a model response, tolerating any fence
+# or prose wrapping
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Spanish month names, indexed by month-1
+_MONTHS_ES = ("enero", "febrero", "marzo", "abril", "mayo", "junio",
+              "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre")
+
+# Generic English queries that yield a usable image for each category on most
+# days - fetched speculatively while the Claude lesson call is in flight
+_CATEGORY_IMAGE_QUERIES = {
+    "Política": "congress building",
+    "Economía": "stock market",
+    "Tecnología": "technology computer",
+}
+
+# Shared session: keep-alive amortizes the TLS handshake across all outbound
+# HTTP, and transient 429/5xx responses are retried with backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])
+))
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; SpanishNewsPDF/1.0)'})
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = _REPO_ROOT / 'pdfs'
+INDEX_FILE = _REPO_ROOT / 'index.json'
+# Source of truth for the PDF history; index.json is regenerated from it
+INDEX_DB = _REPO_ROOT / 'index.sqlite'
+
+# Exact-match cache for Claude lesson output - a rerun with byte-identical
+# RSS input (retry after a PDF/image failure) skips the API call entirely
+CLAUDE_CACHE_DIR = _REPO_ROOT / '.cache' / 'claude'
+
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # =============================================================================
 # NEWS FETCHING (RSS + Claude Selection)
 # =============================================================================
+def _iter_feed_items(content: bytes, limit: int):
+    """Yield up to `limit` <item> elements from RSS bytes, streaming.
+
+    Uses lxml's iterparse when available so parsing stops after the items
+    we need instead of materializing the full feed DOM.
+    """
+    import io
+
+    if HAS_LXML:
+        count = 0
+        for _, elem in lxml_etree.iterparse(io.BytesIO(content), events=('end',), tag='item'):
+            yield elem
+            elem.clear()
+            count += 1
+            if count >= limit:
+                break
+    else:
+        import xml.etree.ElementTree as ET
+        count = 0
+        # Explicit encoding skips expat's charset auto-detection scan -
+        # Google News always serves UTF-8
+        parser = ET.XMLParser(encoding='utf-8')
+        for _, elem in ET.iterparse(io.BytesIO(content), events=('end',), parser=parser):
+            if elem.tag != 'item':
+                continue
+            yield elem
+            elem.clear()
+            count += 1
+            if count >= limit:
+                break
+
+
+def _fetch_one_feed(feed_url: str, category: str) -> Tuple[str, List[Dict]]:
+    """Fetch and parse one Google News RSS feed into story candidates."""
+    import html
+
+    found = []
+    try:
+        response = SESSION.get(feed_url, timeout=15)
+        response.raise_for_status()
+
+        # Get up to 8 items per category for Claude to choose from
+        for item in _iter_feed_items(response.content, 8):
+            title_text = html.unescape(item.findtext('title') or "")
+
+            desc_text = item.findtext('description') or ""
+            if desc_text:
+                desc_text = html.unescape(desc_text)
+                desc_text = _TAG_RE.sub('', desc_text)
+
+            source_text = item.findtext('source') or "News"
+            date_text = item.findtext('pubDate') or ""
+
+            if title_text:
+                found.append({
+                    "title": title_text,
+                    "description": desc_text,
+                    "source": source_text,
+                    "date": date_text
+                })
+
+        print(f"  ✓ {category}: Found {len(found)} candidates")
+
+    except Exception as e:
+        print(f"  ✗ {category} RSS error: {e}")
+
+    return category, found
+
+
 def fetch_rss_candidates() -> Dict[str, List[Dict]]:
     """
-    Fetch multiple news candidates from Google News RSS feeds.
+    Fetch multiple news candidates from Google News RSS feeds in parallel.
     Returns dict of category -> list of story candidates.
     """
-    import xml.etree.ElementTree as ET
-    import html
-    import re
-
     # Google News RSS feeds for different topics
     feeds = [
         ("https://news.google.com/rss/search?q=US+politics+congress+government+when:1d&hl=en-US&gl=US&ceid=US:en", "Política"),
@@ -54,68 +174,53 @@ def fetch_rss_candidates() -> Dict[str, List[Dict]]:
         ("https://news.google.com/rss/search?q=technology+AI+tech+companies+when:1d&hl=en-US&gl=US&ceid=US:en", "Tecnología"),
     ]
 
-    candidates = {}
-
-    for feed_url, category in feeds:
-        candidates[category] = []
-        try:
-            response = requests.get(feed_url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; SpanishNewsPDF/1.0)'
-            })
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            items = root.findall('.//item')
-
-            # Get up to 8 items per category for Claude to choose from
-            for item in items[:8]:
-                title = item.find('title')
-                description = item.find('description')
-                source = item.find('source')
-                pub_date = item.find('pubDate')
-
-                title_text = html.unescape(title.text) if title is not None and title.text else ""
-
-                desc_text = ""
-                if description is not None and description.text:
-                    desc_text = html.unescape(description.text)
-                    desc_text = re.sub(r'<[^>]+>', '', desc_text)
-
-                source_text = source.text if source is not None and source.text else "News"
-                date_text = pub_date.text if pub_date is not None else ""
-
-                if title_text:
-                    candidates[category].append({
-                        "title": title_text,
-                        "description": desc_text,
-                        "source": source_text,
-                        "date": date_text
-                    })
-
-            print(f"  ✓ {category}: Found {len(candidates[category])} candidates")
+    # The three fetches are independent network waits - overlap them so the
+    # RSS stage takes roughly the slowest single feed
+    with ThreadPoolExecutor(max_workers=len(feeds)) as executor:
+        results = list(executor.map(lambda fc: _fetch_one_feed(*fc), feeds))
 
-        except Exception as e:
-            print(f"  ✗ {category} RSS error: {e}")
+    return dict(results)
 
-    return candidates
 
+def _prune_candidates(candidates: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    """Drop near-duplicate headlines and cap candidates at 5 per category.
 
-def fetch_news_stories() -> List[Dict]:
+    Outlets covering the same event produce nearly identical titles -
+    forwarding all of them to Claude wastes input tokens and makes the
+    pick harder. Titles are compared on their first six words (Jaccard
+    similarity above 0.6 counts as a duplicate).
     """
-    Fetch news using RSS feeds, then let Claude pick the best story per category.
-    Combines free RSS with intelligent Claude selection.
+    pruned = {}
+    for category, items in candidates.items():
+        kept = []
+        kept_shingles = []
+        for item in items:
+            shingle = set(item['title'].lower().split()[:6])
+            if any(shingle | seen and len(shingle & seen) / len(shingle | seen) > 0.6
+                   for seen in kept_shingles):
+                continue
+            kept.append(item)
+            kept_shingles.append(shingle)
+            if len(kept) >= 5:
+                break
+        pruned[category] = kept
+    return pruned
+
+
+def fetch_news_stories(candidates: Dict[str, List[Dict]]) -> List[Dict]:
     """
-    # Step 1: Get RSS candidates
-    print("  Fetching RSS candidates...")
-    candidates = fetch_rss_candidates()
+    Let Claude pick the best RSS story per category (legacy two-step path).
 
-    # Step 2: Let Claude pick the best story from each category
+    Kept as the fallback for when the merged selection+adaptation call
+    fails; normal runs go through generate_lesson_from_candidates.
+    """
     print("  Asking Claude to select best stories...")
 
     if not ANTHROPIC_API_KEY:
         print("  ⚠ No Anthropic key - using first RSS item per category")
         return _fallback_first_items(candidates)
 
+    import anthropic
     client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
 
     # Build prompt for Claude to select stories
@@ -135,7 +240,7 @@ CANDIDATES BY CATEGORY:
         for i, item in enumerate(items, 1):
             selection_prompt += f"{i}. [{item['source']}] {item['title']}\n"
             if item['description']:
-                selection_prompt += f"   Summary: {item['description'][:200]}...\n"
+                selection_prompt += f"   Summary: {item['description'][:120]}...\n"
 
     selection_prompt += """
 
@@ -148,22 +253,16 @@ RESPOND WITH JSON ONLY - pick one story number per category:
 """
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-6",
-            max_tokens=500,
+        # Picking "best of 8" per category is a ranking task, not a writing
+        # task - Haiku answers it in a fraction of Sonnet's latency and cost
+        response = _messages_create_maybe_batched(
+            client,
+            model="claude-haiku-4-5",
+            max_tokens=200,
             messages=[{"role": "user", "content": selection_prompt}]
         )
 
-        response_text = response.content[0].text
-
-        # Clean up JSON response
-        if "```" in response_text:
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-        response_text = response_text.strip()
-
-        selections = json.loads(response_text)
+        selections = _parse_lesson_json(response.content[0].text)
 
         # Build final stories list based on Claude's picks
         stories = []
@@ -213,46 +312,55 @@ def _fallback_first_items(candidates: Dict[str, List[Dict]]) -> List[Dict]:
     return stories
 
 
-# =============================================================================
-# STORY ADAPTATION (Anthropic API)
-# =============================================================================
-def adapt_stories_for_spanish_learners(raw_stories: List[Dict]) -> Dict:
-    """
-    Use Anthropic API to adapt news stories for A2-B1 Spanish learners.
-    Returns structured content: vocabulary, adapted stories, quiz questions.
+def _messages_create_maybe_batched(client, **params):
+    """Create a message, optionally via the Message Batches API.
+
+    The daily GitHub Actions run has no latency SLA, and batch processing
+    is billed at 50% of interactive rates. Set USE_BATCH_API=1 to submit
+    through the batch endpoint and poll until it completes; the default
+    stays synchronous for local/interactive runs.
     """
-    if not ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    if not os.environ.get('USE_BATCH_API'):
+        return client.messages.create(**params)
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    import time
 
-    # Build the prompt
-    stories_text = "\n\n".join([
-        f"STORY {i+1} ({s['category']}):\n{s['raw_content']}"
-        for i, s in enumerate(raw_stories)
-    ])
+    batch = client.messages.batches.create(
+        requests=[{"custom_id": "daily-lesson", "params": params}]
+    )
+    print(f"  Batch submitted: {batch.id}")
 
-    prompt = f"""You are an expert Spanish language teacher creating educational content for A2-B1 level learners.
+    while batch.processing_status != "ended":
+        time.sleep(30)
+        batch = client.messages.batches.retrieve(batch.id)
 
-Given these 3 US news stories, create a complete Spanish learning lesson:
+    for result in client.messages.batches.results(batch.id):
+        if result.result.type == "succeeded":
+            return result.result.message
+        raise RuntimeError(f"Batch request {result.custom_id} failed: {result.result.type}")
 
-{stories_text}
+    raise RuntimeError(f"Batch {batch.id} returned no results")
 
-OUTPUT FORMAT (respond with valid JSON only):
 
-{{
+# =============================================================================
+# STORY ADAPTATION (Anthropic API)
+# =============================================================================
+# Shared between the merged one-call path and the legacy two-step path
+LESSON_OUTPUT_SPEC = """OUTPUT FORMAT (respond with valid JSON only):
+
+{
   "vocabulary": [
-    {{
+    {
       "word": "Spanish word",
       "syllables": "stress-marked syllables like sor-TE-o",
       "pos": "sustantivo/verbo/adjetivo/etc",
       "context": "Example sentence from the stories using this word",
       "definition_es": "Simple Spanish definition",
       "definition_en": "English translation"
-    }}
+    }
   ],
   "stories": [
-    {{
+    {
       "category": "Política/Economía/Tecnología",
       "headline_es": "Spanish headline (compelling, A2-B1 level)",
       "headline_en": "English translation of headline",
@@ -260,18 +368,18 @@ OUTPUT FORMAT (respond with valid JSON only):
       "body_en": "English translation of the adapted story",
       "image_query": "2-3 word English search query for Unsplash (e.g., 'congress building', 'stock market')",
       "source": "Original news source if known"
-    }}
+    }
   ],
   "quiz": [
-    {{
+    {
       "number": 1,
       "type": "vocab",
       "question_es": "Question in Spanish about vocabulary",
       "options": ["Option A", "Option B", "Option C", "Option D"],
       "answer": "A"
-    }}
+    }
   ]
-}}
+}
 
 REQUIREMENTS:
 1. Include 6-8 vocabulary words that appear in the stories
@@ -280,25 +388,198 @@ REQUIREMENTS:
 4. Comprehension questions should reference specific stories
 5. All Spanish text should be appropriate for A2-B1 learners
 
-Respond with ONLY the JSON, no other text."""
+Respond with ONLY the JSON - no other text and no ``` fences."""
+
+# Static preamble for the merged selection+adaptation call, kept in its own
+# content block so Anthropic prompt caching can reuse it across runs
+MERGED_LESSON_INSTRUCTIONS = f"""You are an expert Spanish language teacher creating educational content for A2-B1 level learners.
+
+Below are current US news candidates by category. For each category, first pick the ONE best story that:
+1. Is most newsworthy and significant
+2. Has clear, concrete facts (names, numbers, events)
+3. Would be interesting for Spanish learners in the US
+4. Is NOT a duplicate or slight variation of another story
+
+Then create a complete Spanish learning lesson from your three picks. Use each pick's [source] as that story's "source" field.
+
+{LESSON_OUTPUT_SPEC}"""
 
-    response = client.messages.create(
+# Same idea for the legacy two-step adaptation call
+ADAPT_LESSON_INSTRUCTIONS = f"""You are an expert Spanish language teacher creating educational content for A2-B1 level learners.
+
+Given these 3 US news stories, create a complete Spanish learning lesson.
+
+{LESSON_OUTPUT_SPEC}"""
+
+
+def _lesson_cache_key(payload) -> str:
+    """Hash the Claude input (candidates or raw stories) into a cache key."""
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _lesson_cache_get(key: str) -> Optional[Dict]:
+    cache_path = CLAUDE_CACHE_DIR / f"{key}.json"
+    try:
+        with open(cache_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _lesson_cache_put(key: str, lesson: Dict) -> None:
+    try:
+        CLAUDE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = CLAUDE_CACHE_DIR / f"{key}.json"
+        with open(cache_path, 'wb') as f:
+            f.write(orjson.dumps(lesson))
+    except OSError as e:
+        print(f"  ⚠ Could not write lesson cache: {e}")
+
+
+# Keys the PDF builder actually dereferences, per lesson section
+_REQUIRED_LESSON_KEYS = {
+    'vocabulary': ('word', 'definition_es', 'definition_en'),
+    'stories': ('category', 'headline_es', 'body_es'),
+    'quiz': ('number', 'question_es', 'options', 'answer'),
+}
+
+
+def _validate_lesson(lesson: Dict) -> Dict:
+    """Fail fast on schema drift in Claude's output.
+
+    Catching a malformed lesson here lets the caller retry or fall back
+    instead of crashing halfway through PDF rendering.
+    """
+    for section, required in _REQUIRED_LESSON_KEYS.items():
+        items = lesson.get(section)
+        if not isinstance(items, list) or not items:
+            raise ValueError(f"Lesson JSON missing or empty '{section}'")
+        for item in items:
+            missing = [k for k in required if k not in item]
+            if missing:
+                raise ValueError(f"Lesson '{section}' entry missing keys: {missing}")
+    return lesson
+
+
+def _parse_lesson_json(response_text: str) -> Dict:
+    """Extract and parse the JSON object from a model response.
+
+    Slicing the outermost {...} block handles fenced, prefixed, or bare
+    responses with one code path instead of fence-specific string surgery.
+    """
+    match = _JSON_RE.search(response_text)
+    if not match:
+        raise ValueError("No JSON object found in model response")
+    # orjson parses the ~4KB dict-heavy lesson payload 2-3x faster than stdlib
+    return orjson.loads(match.group(0))
+
+
+def generate_lesson_from_candidates(candidates: Dict[str, List[Dict]]) -> Dict:
+    """
+    Generate the full lesson from RSS candidates in a single Claude call.
+
+    Merges the old story-selection call and the adaptation call into one
+    prompt, saving an entire network round trip per run. Falls back to
+    the legacy two-step path if the merged call fails.
+    """
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+
+    if not any(candidates.values()):
+        return adapt_stories_for_spanish_learners(_fallback_first_items(candidates))
+
+    cache_key = _lesson_cache_key(candidates)
+    cached = _lesson_cache_get(cache_key)
+    if cached is not None:
+        print("  ✓ Reusing cached lesson (identical RSS input)")
+        return cached
+
+    import anthropic
+    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+
+    candidates_text = ""
+    for category, items in candidates.items():
+        candidates_text += f"\n## {category}\n"
+        for i, item in enumerate(items, 1):
+            candidates_text += f"{i}. [{item['source']}] {item['title']}\n"
+            if item['description']:
+                candidates_text += f"   Summary: {item['description'][:120]}...\n"
+
+    try:
+        # Static instructions go in their own cached block so every call
+        # after the first reuses the server-side prefix at a 90% discount
+        response = _messages_create_maybe_batched(
+            client,
+            model="claude-sonnet-4-6",
+            max_tokens=4000,
+            messages=[{
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": MERGED_LESSON_INSTRUCTIONS,
+                        "cache_control": {"type": "ephemeral"}
+                    },
+                    {
+                        "type": "text",
+                        "text": f"CANDIDATES BY CATEGORY:\n{candidates_text}"
+                    }
+                ]
+            }]
+        )
+        lesson = _validate_lesson(_parse_lesson_json(response.content[0].text))
+        _lesson_cache_put(cache_key, lesson)
+        return lesson
+    except Exception as e:
+        print(f"  ⚠ Merged lesson call failed ({e}) - falling back to two-step path")
+        raw_stories = fetch_news_stories(candidates)
+        return adapt_stories_for_spanish_learners(raw_stories)
+
+
+def adapt_stories_for_spanish_learners(raw_stories: List[Dict]) -> Dict:
+    """
+    Use Anthropic API to adapt news stories for A2-B1 Spanish learners.
+    Returns structured content: vocabulary, adapted stories, quiz questions.
+    """
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+
+    cache_key = _lesson_cache_key(raw_stories)
+    cached = _lesson_cache_get(cache_key)
+    if cached is not None:
+        print("  ✓ Reusing cached adaptation (identical stories)")
+        return cached
+
+    import anthropic
+    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+
+    # Only the story text varies between runs - the instructions ride the
+    # prompt cache
+    stories_text = "\n\n".join([
+        f"STORY {i+1} ({s['category']}):\n{s['raw_content']}"
+        for i, s in enumerate(raw_stories)
+    ])
+
+    response = _messages_create_maybe_batched(
+        client,
         model="claude-sonnet-4-6",
         max_tokens=4000,
-        messages=[{"role": "user", "content": prompt}]
+        messages=[{
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": ADAPT_LESSON_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {"type": "text", "text": stories_text}
+            ]
+        }]
     )
 
-    # Parse the response
-    response_text = response.content[0].text
-
-    # Clean up JSON if needed
-    if response_text.startswith("```"):
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-    response_text = response_text.strip()
-
-    return json.loads(response_text)
+    lesson = _validate_lesson(_parse_lesson_json(response.content[0].text))
+    _lesson_cache_put(cache_key, lesson)
+    return lesson
 
 
 # =============================================================================
@@ -313,53 +594,94 @@ def generate_daily_pdf() -> str:
     print("SPANISH NEWS PDF GENERATOR")
     print("=" * 60)
 
+    # Short-circuit reruns: if today's PDF is already fresh there is nothing
+    # to do - no RSS, no Claude, no images, no render
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    existing = OUTPUT_DIR / f"spanish_lesson_{date_str}.pdf"
+    if (existing.exists()
+            and not os.environ.get('FORCE_REGENERATE')
+            and time.time() - existing.stat().st_mtime < 12 * 3600):
+        print(f"\nPDF for {date_str} already exists - skipping regeneration")
+        print("  (set FORCE_REGENERATE=1 to rebuild)")
+        return str(existing)
+
+    from pdf_builder import SpanishLearningPDF, fetch_unsplash_image
+
     # 1. Fetch news
     print("\n[1/5] Fetching current US news...")
-    raw_stories = fetch_news_stories()
-    print(f"  Found {len(raw_stories)} stories")
-    for s in raw_stories:
-        print(f"    - {s['category']}: {s['raw_content'][:50]}...")
-
-    # 2. Adapt for Spanish learners
-    print("\n[2/5] Adapting stories for Spanish learners (Anthropic API)...")
-    lesson_content = adapt_stories_for_spanish_learners(raw_stories)
-    print(f"  Vocabulary: {len(lesson_content.get('vocabulary', []))} words")
-    print(f"  Stories: {len(lesson_content.get('stories', []))}")
-    print(f"  Quiz questions: {len(lesson_content.get('quiz', []))}")
-
-    # 3. Fetch images for each story
-    print("\n[3/5] Fetching Unsplash images...")
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    for i, story in enumerate(lesson_content.get('stories', [])):
-        query = story.get('image_query', story.get('category', 'news'))
-        output_path = os.path.join(OUTPUT_DIR, f"story_{i+1}_image.jpg")
-
-        print(f"  Story {i+1}: Searching '{query}'...")
-        result = fetch_unsplash_image(
-            query=query,
-            api_key=UNSPLASH_API_KEY,
-            output_path=output_path
-        )
-
-        if result:
-            story['image_path'] = result['image_path']
-            story['image_attribution'] = result['attribution']
-            print(f"    ✓ Downloaded: {result['attribution']}")
-        else:
-            print(f"    ✗ No image found")
+    candidates = _prune_candidates(fetch_rss_candidates())
+    print(f"  Found {sum(len(v) for v in candidates.values())} candidates")
+
+    # 2. Select + adapt for Spanish learners in one Claude call, with
+    # speculative category-based image fetches overlapping the API wait
+    print("\n[2/5] Generating Spanish lesson (Anthropic API)...")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        lesson_future = executor.submit(generate_lesson_from_candidates, candidates)
+        speculative = {
+            category: executor.submit(
+                fetch_unsplash_image,
+                query=spec_query,
+                api_key=UNSPLASH_API_KEY,
+                output_path=str(OUTPUT_DIR / f"speculative_{n}_image.jpg")
+            )
+            for n, (category, spec_query) in enumerate(_CATEGORY_IMAGE_QUERIES.items(), 1)
+        }
+
+        lesson_content = lesson_future.result()
+        print(f"  Vocabulary: {len(lesson_content.get('vocabulary', []))} words")
+        print(f"  Stories: {len(lesson_content.get('stories', []))}")
+        print(f"  Quiz questions: {len(lesson_content.get('quiz', []))}")
+
+        # 3. Fetch images for each story
+        print("\n[3/5] Fetching Unsplash images...")
+        stories = lesson_content.get('stories', [])
+        futures = {}
+        for i, story in enumerate(stories):
+            query = story.get('image_query', story.get('category', 'news'))
+            spec_query = _CATEGORY_IMAGE_QUERIES.get(story.get('category'), '')
+            spec_future = speculative.get(story.get('category'))
+
+            # If Claude's query adds nothing beyond the generic category query,
+            # the prefetched image is just as good - reuse it and skip a fetch
+            if spec_future is not None and set(query.lower().split()) & set(spec_query.split()):
+                result = spec_future.result()
+                if result:
+                    stories[i]['image_path'] = result['image_path']
+                    stories[i]['image_attribution'] = result['attribution']
+                    print(f"    ✓ Story {i+1}: prefetched '{spec_query}' image")
+                    continue
+
+            output_path = str(OUTPUT_DIR / f"story_{i+1}_image.jpg")
+            print(f"  Story {i+1}: Searching '{query}'...")
+            future = executor.submit(
+                fetch_unsplash_image,
+                query=query,
+                api_key=UNSPLASH_API_KEY,
+                output_path=output_path
+            )
+            futures[future] = i
+
+        for future in as_completed(futures):
+            i = futures[future]
+            result = future.result()
+            if result is None:
+                # Targeted query found nothing - fall back to the prefetch
+                spec_future = speculative.get(stories[i].get('category'))
+                result = spec_future.result() if spec_future is not None else None
+            if result:
+                stories[i]['image_path'] = result['image_path']
+                stories[i]['image_attribution'] = result['attribution']
+                print(f"    ✓ Story {i+1}: {result['attribution']}")
+            else:
+                print(f"    ✗ Story {i+1}: No image found")
 
     # 4. Build PDF
     print("\n[4/5] Building PDF...")
 
     # Format date in Spanish
     today = datetime.now()
-    months_es = {
-        1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
-        5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
-        9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre"
-    }
-    date_es = f"{today.day} de {months_es[today.month]} de {today.year}"
+    date_es = f"{today.day} de {_MONTHS_ES[today.month - 1]} de {today.year}"
 
     pdf = SpanishLearningPDF(
         title="Español con Noticias",
@@ -380,8 +702,7 @@ def generate_daily_pdf() -> str:
         pdf.add_quiz_question(q)
 
     # Save PDF
-    date_str = today.strftime("%Y-%m-%d")
-    output_path = os.path.join(OUTPUT_DIR, f"spanish_lesson_{date_str}.pdf")
+    output_path = str(OUTPUT_DIR / f"spanish_lesson_{date_str}.pdf")
     pdf.save(output_path)
 
     # 5. Update index
@@ -395,16 +716,29 @@ def generate_daily_pdf() -> str:
     return output_path
 
 
-def update_index(date_str: str, pdf_path: str, lesson_content: Dict):
-    """Update the index.json manifest file."""
-    # Load existing index
-    if os.path.exists(INDEX_FILE):
-        with open(INDEX_FILE, 'r') as f:
-            index = json.load(f)
-    else:
-        index = {"pdfs": [], "generated": datetime.now().isoformat()}
+def _open_index_db() -> sqlite3.Connection:
+    """Open index.sqlite, creating the table and importing any pre-sqlite
+    index.json history on first run."""
+    con = sqlite3.connect(INDEX_DB)
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS pdfs "
+        "(date TEXT PRIMARY KEY, filename TEXT, payload BLOB, generated_at TEXT)"
+    )
+    if con.execute("SELECT COUNT(*) FROM pdfs").fetchone()[0] == 0 and INDEX_FILE.exists():
+        with open(INDEX_FILE, 'rb') as f:
+            legacy = orjson.loads(f.read())
+        with con:
+            con.executemany(
+                "INSERT OR REPLACE INTO pdfs VALUES (?, ?, ?, ?)",
+                [(p.get('date'), p.get('filename'), orjson.dumps(p), p.get('generated_at'))
+                 for p in legacy.get('pdfs', []) if p.get('date')]
+            )
+    return con
 
-    # Add new entry with full lesson content
+
+def update_index(date_str: str, pdf_path: str, lesson_content: Dict):
+    """Update the sqlite index and regenerate the index.json manifest."""
+    # Build new entry with full lesson content
     entry = {
         "date": date_str,
         "filename": os.path.basename(pdf_path),
@@ -427,16 +761,27 @@ def update_index(date_str: str, pdf_path: str, lesson_content: Dict):
         "generated_at": datetime.now().isoformat()
     }
 
-    # Remove existing entry for same date if exists
-    index['pdfs'] = [p for p in index.get('pdfs', []) if p.get('date') != date_str]
-
-    # Add new entry at the beginning
-    index['pdfs'].insert(0, entry)
-    index['last_updated'] = datetime.now().isoformat()
-
-    # Save index
-    with open(INDEX_FILE, 'w') as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    # INSERT OR REPLACE on the date primary key replaces the old linear
+    # same-date scan, and sqlite's journal makes the write atomic
+    con = _open_index_db()
+    try:
+        with con:
+            con.execute(
+                "INSERT OR REPLACE INTO pdfs VALUES (?, ?, ?, ?)",
+                (date_str, entry['filename'], orjson.dumps(entry), entry['generated_at'])
+            )
+        rows = con.execute("SELECT payload FROM pdfs ORDER BY date DESC").fetchall()
+    finally:
+        con.close()
+
+    # Regenerate index.json for the static website - same shape as before so
+    # consumers don't change
+    index = {
+        "pdfs": [orjson.loads(row[0]) for row in rows],
+        "last_updated": datetime.now().isoformat()
+    }
+    with open(INDEX_FILE, 'wb') as f:
+        f.write(orjson.dumps(index, option=orjson.OPT_INDENT_2))
 
     print(f"  Index updated: {len(index['pdfs'])} total PDFs")
 
@@ -13,40 +13,98 @@ Uses Google News RSS with medical queries for story candidates, Claude for adapt
 7-day search window due to lower volume of wound care news.
 """
 
+import asyncio
+import hashlib
+import io
 import os
+import shutil
 import sys
 import json
+import time
+import orjson
 import requests
 import xml.etree.ElementTree as ET
 import html
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
-import anthropic
-from openai import OpenAI
+from urllib.parse import urlsplit, unquote
+from requests.adapters import HTTPAdapter
+
+# The anthropic and openai SDKs (and openai's httpx stack) are imported
+# lazily inside the functions that call them: the daily "no new news" run
+# exits before ever needing them, and deferring the imports shaves their
+# pydantic-heavy startup cost off that path. requests stays top-level
+# because every run fetches the feeds.
+
+# Optional: lxml's libxml2-backed parser is 2-5x faster than stdlib
+# ElementTree on the RSS feeds (fallback to stdlib if not installed)
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 # Configuration
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 OUTPUT_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'wound-care-stories-index.json')
+# Append-only story log: one JSON object per line, newest last. O(new) to
+# update and streamable for dedupe, unlike the full index rewrite
+STORIES_JSONL = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'wound-care-stories.jsonl')
+# Route Claude calls through the Message Batches API (50% token price, but
+# minutes of added latency) - fine for the daily cron, off for dev runs
+USE_BATCH_API = bool(os.environ.get('USE_BATCH_API'))
 AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'audio', 'wound-care-stories')
+# Content-addressed MP3 cache shared with the other generators - TTS output
+# is deterministic for identical input, so an unchanged body_es costs a file
+# copy instead of the slowest API call in the pipeline
+TTS_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'audio', '.tts_cache')
+TTS_MODEL = "gpt-4o-mini-tts-2025-12-15"
+TTS_VOICE = "coral"
+TTS_INSTRUCTIONS = "Speak with a clear, professional Mexican Spanish accent. Pronounce medical terminology clearly and at a moderate pace suitable for Spanish language learners in healthcare settings. Warm but professional tone."
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/gramnegrod/spanish-news-pdfs/main"
 
-# Wound care category configuration
+# Strips embedded HTML from RSS descriptions - compiled once, not per item
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Shared session: keep-alive reuses one TLS connection to news.google.com
+# across all six feeds instead of a fresh handshake per category
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; WoundCareNewsBot/1.0)'})
+
+# Wound care category configuration, kept as parallel tuples so the hot
+# loops iterate a zip instead of doing a dict lookup per field
+CATEGORY_NAMES = (
+    "Chronic Wounds", "Pressure Ulcers", "Diabetic Foot",
+    "Burn Care", "Surgical Wounds", "Wound Research",
+)
+CATEGORY_EMOJIS = ("🩹", "🛏️", "👣", "🔥", "🏥", "🔬")
+CATEGORY_GRADIENTS = ("teal", "rose", "amber", "orange", "blue", "purple")
+CATEGORY_QUERIES = (
+    "chronic+wound+healing+treatment+ulcer",
+    "pressure+ulcer+bedsore+decubitus+prevention",
+    "diabetic+foot+ulcer+amputation+prevention",
+    "burn+wound+treatment+healing+skin+graft",
+    "surgical+wound+healing+post+operative+infection",
+    "wound+healing+research+innovation+therapy",
+)
+
+# Feed URLs never change within a run - format them once at import.
+# 7-day window for medical news (lower volume than general news).
+CATEGORY_FEED_URLS = tuple(
+    f"https://news.google.com/rss/search?q={query}+when:7d&hl=en-US&gl=US&ceid=US:en"
+    for query in CATEGORY_QUERIES
+)
+
+# Back-compat record view for anything that wants one dict per category
 CATEGORIES = [
-    {"name": "Chronic Wounds", "emoji": "🩹", "gradient": "teal",
-     "query": "chronic+wound+healing+treatment+ulcer"},
-    {"name": "Pressure Ulcers", "emoji": "🛏️", "gradient": "rose",
-     "query": "pressure+ulcer+bedsore+decubitus+prevention"},
-    {"name": "Diabetic Foot", "emoji": "👣", "gradient": "amber",
-     "query": "diabetic+foot+ulcer+amputation+prevention"},
-    {"name": "Burn Care", "emoji": "🔥", "gradient": "orange",
-     "query": "burn+wound+treatment+healing+skin+graft"},
-    {"name": "Surgical Wounds", "emoji": "🏥", "gradient": "blue",
-     "query": "surgical+wound+healing+post+operative+infection"},
-    {"name": "Wound Research", "emoji": "🔬", "gradient": "purple",
-     "query": "wound+healing+research+innovation+therapy"},
+    {"name": name, "emoji": emoji, "gradient": gradient, "query": query}
+    for name, emoji, gradient, query
+    in zip(CATEGORY_NAMES, CATEGORY_EMOJIS, CATEGORY_GRADIENTS, CATEGORY_QUERIES)
 ]
 
 # Difficulty distribution - A2 for basic, B1 for more complex
@@ -70,201 +128,345 @@ CATEGORY_SLUGS = {
 }
 
 
-def load_existing_stories() -> tuple[List[Dict], Set[str]]:
-    """Load existing stories from JSON file and extract source URLs for deduplication."""
-    existing_stories = []
-    existing_urls = set()
+# Fast path for redirector links that carry the real article in a url= param
+_URL_PARAM_RE = re.compile(r'[?&]url=([^&]+)')
+
+
+def _canonical(url: str) -> str:
+    """Reduce a URL to a stable form for deduplication.
+
+    Google News wraps links in redirector URLs whose query parameters
+    rotate between runs, so comparing raw strings re-ingests the same
+    article under a fresh query string. Unwrap the url= param when
+    present, lowercase the host, and drop the query and trailing slash.
+    """
+    match = _URL_PARAM_RE.search(url)
+    if match:
+        url = unquote(match.group(1))
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
 
+
+def load_full_existing() -> List[Dict]:
+    """Load the full existing story list from the index file."""
     if os.path.exists(OUTPUT_FILE):
         try:
-            with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                existing_stories = data.get("stories", [])
-                # Extract source URLs for deduplication
-                for story in existing_stories:
-                    url = story.get("source_url", "")
-                    if url:
-                        existing_urls.add(url)
-                print(f"  Loaded {len(existing_stories)} existing stories ({len(existing_urls)} unique URLs)")
+            with open(OUTPUT_FILE, 'rb') as f:
+                # orjson loads the ever-growing index far faster than stdlib
+                data = orjson.loads(f.read())
+            return data.get("stories", [])
         except Exception as e:
             print(f"  ⚠ Could not load existing stories: {e}")
+    return []
+
+
+def load_existing_urls() -> Set[str]:
+    """Build the source-URL dedupe set without materializing full stories.
+
+    RSS filtering only needs the URLs, so stream the JSONL log one line
+    at a time when it exists; the full story dicts aren't loaded until
+    the merge step actually needs them. Falls back to the index file for
+    checkouts that predate the log.
+    """
+    existing_urls = set()
+
+    if os.path.exists(STORIES_JSONL):
+        try:
+            with open(STORIES_JSONL, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        url = orjson.loads(line).get("source_url", "")
+                        if url:
+                            existing_urls.add(_canonical(url))
+            print(f"  Loaded {len(existing_urls)} existing URLs from story log")
+            return existing_urls
+        except Exception as e:
+            print(f"  ⚠ Could not stream story log: {e}")
+
+    for story in load_full_existing():
+        url = story.get("source_url", "")
+        if url:
+            existing_urls.add(_canonical(url))
+
+    if existing_urls:
+        print(f"  Loaded {len(existing_urls)} existing URLs from index")
     else:
-        print("  No existing stories file found - starting fresh")
+        print("  No existing stories found - starting fresh")
 
-    return existing_stories, existing_urls
+    return existing_urls
 
 
-def fetch_rss_candidates(existing_urls: Set[str]) -> Dict[str, List[Dict]]:
-    """Fetch news candidates from Google News RSS for each wound care category.
-    Uses 7-day window due to lower volume of medical news.
-    Filters out URLs that already exist in our stories."""
-    candidates = {}
+def _iter_feed_items(content: bytes, limit: int):
+    """Yield up to `limit` <item> elements from RSS bytes, streaming.
 
-    for cat in CATEGORIES:
-        category = cat["name"]
-        query = cat["query"]
-        # Use 7-day window for medical news (lower volume than general news)
-        feed_url = f"https://news.google.com/rss/search?q={query}+when:7d&hl=en-US&gl=US&ceid=US:en"
+    Uses lxml's iterparse when available so parsing stops after the items
+    we need instead of materializing the full feed DOM - Google News
+    descriptions carry large embedded HTML, so skipping the tail matters.
+    """
+    if HAS_LXML:
+        count = 0
+        for _, elem in lxml_etree.iterparse(io.BytesIO(content), events=('end',), tag='item'):
+            yield elem
+            # Free the item and the cleared skeletons of its earlier
+            # siblings, which elem.clear() alone leaves chained to the
+            # channel element
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            count += 1
+            if count >= limit:
+                break
+    else:
+        count = 0
+        # Explicit encoding skips expat's charset auto-detection scan -
+        # Google News always serves UTF-8
+        parser = ET.XMLParser(encoding='utf-8')
+        for _, elem in ET.iterparse(io.BytesIO(content), events=('end',), parser=parser):
+            if elem.tag != 'item':
+                continue
+            yield elem
+            elem.clear()
+            count += 1
+            if count >= limit:
+                break
+
+
+# On-disk ETag store (keyed by category) so re-runs within Google's caching
+# window get a tiny 304 Not Modified instead of six full feed downloads
+_RSS_ETAG_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache', 'rss_etag.json')
+
+
+def _load_rss_etags() -> Dict[str, str]:
+    """Load the category -> ETag map from the last run (empty if none)."""
+    try:
+        with open(_RSS_ETAG_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
 
-        candidates[category] = []
 
-        try:
-            response = requests.get(feed_url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; WoundCareNewsBot/1.0)'
-            })
-            response.raise_for_status()
+def _save_rss_etags(etags: Dict[str, str]) -> None:
+    """Persist the category -> ETag map for the next run."""
+    try:
+        os.makedirs(os.path.dirname(_RSS_ETAG_FILE), exist_ok=True)
+        with open(_RSS_ETAG_FILE, 'wb') as f:
+            f.write(orjson.dumps(etags))
+    except OSError as e:
+        print(f"  ⚠ Could not save RSS ETag store: {e}")
+
+
+def _fetch_one(name: str, feed_url: str, etags: Dict[str, str]) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """Fetch one category's RSS feed, returning (category, feed bytes, etag)."""
+    prev_etag = etags.get(name)
+    headers = {'If-None-Match': prev_etag} if prev_etag else {}
+    try:
+        response = _SESSION.get(feed_url, timeout=15, headers=headers)
+        if response.status_code == 304:
+            # Feed bytes haven't changed since the last run - nothing to parse
+            print(f"  - {name}: feed unchanged (304)")
+            return name, None, prev_etag
+        response.raise_for_status()
+        return name, response.content, response.headers.get('ETag')
+    except Exception as e:
+        print(f"  ✗ {name}: RSS error - {e}")
+        return name, None, prev_etag
 
-            root = ET.fromstring(response.content)
-            items = root.findall('.//item')
 
-            new_count = 0
-            skipped_count = 0
+def _parse_feed(content: bytes, existing_urls: Set[str]) -> Tuple[List[Dict], int]:
+    """Parse feed bytes into up to 3 new candidates, counting skipped URLs."""
+    items = []
+    skipped_count = 0
 
-            for item in items[:10]:  # Check up to 10 per category
-                title = item.find('title')
-                description = item.find('description')
-                source = item.find('source')
-                link = item.find('link')
+    # Locals for the per-item loop: LOAD_FAST instead of a global (or
+    # attribute) lookup per field
+    _unescape = html.unescape
+    _strip_tags = _TAG_RE.sub
 
-                title_text = html.unescape(title.text) if title is not None and title.text else ""
-                link_text = link.text if link is not None and link.text else ""
+    for item in _iter_feed_items(content, 10):  # Check up to 10 per category
+        # findtext folds the find + None-check + .text dance into one
+        # call per field
+        title_text = _unescape(item.findtext('title', '') or '')
+        link_text = item.findtext('link', '') or ''
 
-                # Skip if we already have this URL
-                if link_text in existing_urls:
-                    skipped_count += 1
-                    continue
+        # Skip if no URL (can't verify source)
+        if not link_text:
+            continue
 
-                # Skip if no URL (can't verify source)
-                if not link_text:
-                    continue
+        # Skip if we already have this URL (canonical form, so a
+        # rotated redirector query string doesn't defeat the check)
+        if _canonical(link_text) in existing_urls:
+            skipped_count += 1
+            continue
 
-                desc_text = ""
-                if description is not None and description.text:
-                    desc_text = html.unescape(description.text)
-                    desc_text = re.sub(r'<[^>]+>', '', desc_text)
+        desc_text = item.findtext('description', '') or ''
+        if desc_text:
+            desc_text = _strip_tags('', _unescape(desc_text))
 
-                source_text = source.text if source is not None and source.text else "Medical News"
+        source_text = item.findtext('source', '') or "Medical News"
 
-                if title_text:
-                    candidates[category].append({
-                        "title": title_text,
-                        "description": desc_text,
-                        "source": source_text,
-                        "url": link_text
-                    })
-                    new_count += 1
+        if title_text:
+            items.append({
+                "title": title_text,
+                "description": desc_text,
+                "source": source_text,
+                "url": link_text
+            })
 
-                    # Only keep up to 3 NEW candidates per category
-                    if new_count >= 3:
-                        break
+            # Only keep up to 3 NEW candidates per category
+            if len(items) >= 3:
+                break
 
-            if new_count > 0:
-                print(f"  ✓ {category}: {new_count} NEW candidates (skipped {skipped_count} existing)")
-            else:
-                print(f"  - {category}: No new news (skipped {skipped_count} existing)")
+    return items, skipped_count
+
+
+def _fetch_and_parse_one(name: str, feed_url: str, etags: Dict[str, str],
+                         existing_urls: Set[str]) -> Tuple[str, List[Dict], int, Optional[str]]:
+    """Worker: fetch one feed and parse it, returning (name, items, skipped, etag)."""
+    name, content, etag = _fetch_one(name, feed_url, etags)
+    if content is None:
+        return name, [], 0, etag
+    try:
+        items, skipped_count = _parse_feed(content, existing_urls)
+        return name, items, skipped_count, etag
+    except Exception as e:
+        print(f"  ✗ {name}: RSS error - {e}")
+        return name, [], 0, etag
+
+
+# Normalizes titles for cross-category duplicate detection
+_NON_WORD_RE = re.compile(r'\W+')
 
-        except Exception as e:
-            print(f"  ✗ {category}: RSS error - {e}")
+
+def _dedupe_across_categories(candidates: Dict[str, List[Dict]]) -> None:
+    """Drop candidates whose titles near-duplicate one already kept.
+
+    The six query feeds overlap heavily (an ulcer study surfaces under
+    both Diabetic Foot and Chronic Wounds), and every surviving duplicate
+    is billed input tokens twice. Titles are compared normalized, plus a
+    token-set Jaccard check to catch light rewording; the first category
+    in the fixed order keeps the story.
+    """
+    seen_norms = set()
+    seen_tokens = []
+    for category in CATEGORY_NAMES:
+        kept = []
+        for item in candidates[category]:
+            norm = _NON_WORD_RE.sub(' ', item['title'].lower()).strip()
+            tokens = set(norm.split())
+            if norm in seen_norms:
+                continue
+            if tokens and any(
+                len(tokens & prev) / len(tokens | prev) > 0.8
+                for prev in seen_tokens
+            ):
+                continue
+            seen_norms.add(norm)
+            seen_tokens.append(tokens)
+            kept.append(item)
+        candidates[category] = kept
+
+
+def fetch_rss_candidates(existing_urls: Set[str]) -> Dict[str, List[Dict]]:
+    """Fetch news candidates from Google News RSS for each wound care category.
+    Uses 7-day window due to lower volume of medical news.
+    Filters out URLs that already exist in our stories."""
+    candidates = {name: [] for name in CATEGORY_NAMES}
+
+    # The six feeds are independent network waits - fetch AND parse them in
+    # the workers, so feeds that arrive early are parsed while the slow ones
+    # are still downloading
+    etags = _load_rss_etags()
+    skipped = {}
+    with ThreadPoolExecutor(max_workers=len(CATEGORY_NAMES)) as executor:
+        futures = [
+            executor.submit(_fetch_and_parse_one, name, feed_url, etags, existing_urls)
+            for name, feed_url in zip(CATEGORY_NAMES, CATEGORY_FEED_URLS)
+        ]
+        for f in as_completed(futures):
+            category, items, skipped_count, etag = f.result()
+            candidates[category] = items
+            skipped[category] = skipped_count
+            if etag:
+                etags[category] = etag
+    _save_rss_etags(etags)
+
+    # One story should reach Claude once, whichever feeds carried it
+    _dedupe_across_categories(candidates)
+
+    for category in CATEGORY_NAMES:
+        new_count = len(candidates[category])
+        if new_count > 0:
+            print(f"  ✓ {category}: {new_count} NEW candidates (skipped {skipped.get(category, 0)} existing)")
+        else:
+            print(f"  - {category}: No new news (skipped {skipped.get(category, 0)} existing)")
 
     return candidates
 
 
+# Tokenizes JSON into complete strings, a possibly-unterminated trailing
+# string, or structural braces/brackets - string contents are skipped
+# atomically so embedded braces never miscount
+_JSON_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|"(?:\\.|[^"\\])*$|[{}\[\]]')
+
+
 def repair_truncated_json(text: str) -> str:
     """Attempt to repair truncated JSON by closing open structures.
 
     This handles cases where Claude's response gets cut off mid-JSON,
-    leaving unterminated strings, arrays, or objects.
+    leaving unterminated strings, arrays, or objects. One regex pass over
+    the structural tokens replaces the old per-character Python loop.
     """
-    # If already valid, return as-is
-    try:
-        json.loads(text)
-        return text
-    except json.JSONDecodeError:
-        pass
-
-    # Count unclosed structures
-    in_string = False
-    escape_next = False
-    open_braces = 0
-    open_brackets = 0
-
-    for i, char in enumerate(text):
-        if escape_next:
-            escape_next = False
-            continue
-        if char == '\\':
-            escape_next = True
-            continue
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if char == '{':
-            open_braces += 1
-        elif char == '}':
-            open_braces -= 1
-        elif char == '[':
-            open_brackets += 1
-        elif char == ']':
-            open_brackets -= 1
+    stack = []
+    unterminated_string = False
+
+    for match in _JSON_TOKEN_RE.finditer(text):
+        token = match.group(0)
+        if token[0] == '"':
+            # Only the trailing-string alternative can lack a closing quote
+            unterminated_string = len(token) < 2 or token[-1] != '"'
+        elif token in '{[':
+            stack.append(token)
+        elif stack:
+            stack.pop()
 
     # If we ended inside a string, close it
-    if in_string:
+    if unterminated_string:
         text += '"'
 
-    # Close any open brackets/braces
-    text += ']' * open_brackets
-    text += '}' * open_braces
+    # Close open structures innermost-first so nesting stays valid
+    text += ''.join('}' if opener == '{' else ']' for opener in reversed(stack))
 
     return text
 
 
-def generate_stories_with_claude(candidates: Dict[str, List[Dict]]) -> List[Dict]:
-    """Use Claude to select and adapt wound care stories for categories with news."""
+def parse_or_repair_json(text: str) -> Dict:
+    """Parse JSON text, repairing truncation only if the first parse fails.
 
-    if not ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    The happy path (the 99% case) is a single parse; the repair scan and
+    second parse only run on genuinely broken responses. orjson parses and
+    UTF-8-validates in C (and its JSONDecodeError subclasses the stdlib
+    one, so callers can keep catching json.JSONDecodeError).
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return orjson.loads(repair_truncated_json(text))
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
 
-    # Build prompt with only categories that have NEW candidates
-    prompt = """You are creating Spanish wound care news stories for healthcare professionals learning medical Spanish.
+# Static story-generation instructions, kept in their own content block so
+# Anthropic prompt caching can reuse the prefix across daily runs - only the
+# candidate list and date vary per call
+STORY_PROMPT_STATIC = """You are creating Spanish wound care news stories for healthcare professionals learning medical Spanish.
 
 TARGET AUDIENCE: Nurses, wound care specialists, and healthcare workers who need to communicate about wound care in Spanish.
 
 For each category below, select the best news story and adapt it to Spanish at the specified CEFR level.
 
-NEWS CANDIDATES BY CATEGORY:
-"""
-
-    # Only include categories that have RSS candidates
-    categories_with_news = []
-    for cat in CATEGORIES:
-        category = cat["name"]
-        if category in candidates and candidates[category]:
-            categories_with_news.append(cat)
-            difficulty = DIFFICULTY_MAP[category]
-            prompt += f"\n## {category} (Target: {difficulty} level)\n"
-            for i, item in enumerate(candidates[category], 1):
-                prompt += f"{i}. [{item['source']}] {item['title']}\n"
-                prompt += f"   URL: {item['url']}\n"
-                if item['description']:
-                    prompt += f"   {item['description'][:150]}...\n"
-
-    # If no categories have NEW news, return empty
-    if not categories_with_news:
-        print("  No NEW news candidates - nothing to generate")
-        return []
-
-    prompt += """
-
-OUTPUT FORMAT - Return valid JSON with ONE story per category listed above (only categories with news candidates):
+OUTPUT FORMAT - Return valid JSON with ONE story per category listed below (only categories with news candidates):
 
 {
   "stories": [
     {
-      "id": "chronic-wounds-YYYYMMDD",
       "category": "Chronic Wounds",
       "difficulty": "A2",
       "emoji": "🩹",
@@ -311,104 +513,405 @@ Include vocabulary from these domains:
 - Conditions: infección, necrosis, edema, eritema, isquemia
 
 REQUIREMENTS:
-1. ONLY create stories for categories listed above (those with news candidates)
+1. ONLY create stories for categories listed below (those with news candidates)
 2. Each story must have exactly 4 vocabulary words
 3. Vocabulary should be medical terms that appear in the story
-4. Use today's date in the id field: """ + datetime.now().strftime("%Y%m%d") + """
-5. Stories must be based on actual medical news - NO fabricated stories
-6. Include specific statistics, hospital names, or study details from the source
-7. Content should be professionally appropriate for healthcare settings
-8. CRITICAL: Every story MUST have a real source_url copied EXACTLY from the candidate list
+4. Stories must be based on actual medical news - NO fabricated stories
+5. Include specific statistics, hospital names, or study details from the source
+6. Content should be professionally appropriate for healthcare settings
+7. CRITICAL: Every story MUST have a real source_url copied EXACTLY from the candidate list
 
 Return ONLY the JSON, no other text."""
 
-    print(f"\n  Calling Claude API for {len(categories_with_news)} categories with new news...")
 
-    # Retry logic for malformed JSON responses
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            response = client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=12000,  # Increased for 6 stories with Spanish text
-                messages=[{"role": "user", "content": prompt}]
+def _messages_create_maybe_batched(client, custom_id="wound-care-daily", **params):
+    """Create a message, optionally via the Message Batches API.
+
+    With USE_BATCH_API set, the request is submitted as a one-item batch
+    (billed at half the standard rate), polled every 30s, and the single
+    result returned. Otherwise this is a plain synchronous call.
+    """
+    if not USE_BATCH_API:
+        return client.messages.create(**params)
+
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": custom_id, "params": params}
+    ])
+    print(f"  Submitted batch {batch.id} - polling for completion...")
+    while batch.processing_status in ("in_progress", "canceling"):
+        time.sleep(30)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    for result in client.messages.batches.results(batch.id):
+        if result.result.type == "succeeded":
+            return result.result.message
+        raise RuntimeError(f"Batch request {result.custom_id} failed: {result.result.type}")
+
+    raise RuntimeError(f"Batch {batch.id} returned no results")
+
+
+# Story shape contract with Claude: everything downstream (TTS, the website
+# index) assumes these are present, so fail at this boundary rather than
+# there. The id is stamped locally, not by Claude, so it isn't checked here.
+_REQUIRED_STORY_KEYS = (
+    'category', 'difficulty', 'headline_es', 'body_es', 'source_url'
+)
+
+
+def _validate_story(story: Dict) -> None:
+    """Raise ValueError if a generated story is missing required fields."""
+    for key in _REQUIRED_STORY_KEYS:
+        if not story.get(key):
+            raise ValueError(f"story missing {key!r}")
+    vocab = story.get('key_vocabulary')
+    if not isinstance(vocab, list) or len(vocab) != 4:
+        raise ValueError("story needs exactly 4 key_vocabulary entries")
+
+
+# Exact-match response cache: with the 7-day RSS window a retry or manual
+# re-run often sees the same candidate set it already paid Claude for.
+# Generation is side-effect-free, so replaying the cached stories is safe.
+STORY_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache', 'claude_stories')
+
+
+def _story_cache_key(category: str, items: List[Dict]) -> str:
+    """Hash of this call's inputs, bucketed by day so stale hits age out."""
+    payload = {
+        "content_type": "wound-care",
+        "category": category,
+        "items": items,
+        "date": datetime.now().strftime("%Y%m%d"),
+    }
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _story_cache_get(key: str) -> Optional[List[Dict]]:
+    """Return cached stories for this key, or None."""
+    try:
+        with open(os.path.join(STORY_CACHE_DIR, f"{key}.json"), 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _story_cache_put(key: str, stories: List[Dict]) -> None:
+    """Store one call's stories; cache failures are never fatal."""
+    try:
+        os.makedirs(STORY_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(STORY_CACHE_DIR, f"{key}.json"), 'wb') as f:
+            f.write(orjson.dumps(stories))
+    except OSError as e:
+        print(f"  ⚠ Could not write story cache: {e}")
+
+
+# The per-category prompt headers derive from fixed config, so format them
+# once at import; call-time assembly is reduced to joining candidate lines
+_CATEGORY_PROMPT_HEADERS = {
+    name: f"NEWS CANDIDATES BY CATEGORY:\n\n## {name} (Target: {DIFFICULTY_MAP[name]} level)\n"
+    for name in CATEGORY_NAMES
+}
+
+
+def _generate_category_stories(client, category: str, items: List[Dict]) -> List[Dict]:
+    """Generate the stories for one category with a small, focused call."""
+    cache_key = _story_cache_key(category, items)
+    cached = _story_cache_get(cache_key)
+    if cached is not None:
+        print(f"  ✓ {category}: reusing cached stories (same candidates today)")
+        return cached
+
+    parts = [_CATEGORY_PROMPT_HEADERS[category]]
+    for i, item in enumerate(items, 1):
+        parts.append(f"{i}. [{item['source']}] {item['title']}\n   URL: {item['url']}\n")
+        if item['description']:
+            parts.append(f"   {item['description'][:150]}...\n")
+    candidates_block = ''.join(parts)
+
+    # At most one immediate re-ask on malformed JSON: the static preamble is
+    # prompt-cached and the dynamic block is identical, so the second call
+    # bills roughly a tenth of the first. No sleep - this isn't a rate-limit
+    # path (the SDK backs off on those itself).
+    for attempt in (1, 2):
+        response = _messages_create_maybe_batched(
+            client,
+            custom_id=f"wound-care-{CATEGORY_SLUGS.get(category, 'story')}",
+            model="claude-haiku-4-5-20251001",
+            max_tokens=2000,  # One story per call - no truncation at this budget
+            # Instructions live in the system prompt; the user turn is purely
+            # the dynamic candidate list, so the cache prefix never shifts
+            system=[{
+                "type": "text",
+                "text": STORY_PROMPT_STATIC,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            messages=[{"role": "user", "content": candidates_block}]
+        )
+
+        response_text = response.content[0].text.strip()
+
+        # Strip optional markdown fences in place - no split() list of
+        # intermediate strings, and a lone opening fence no longer
+        # discards the rest of the response
+        if response_text.startswith("```"):
+            response_text = (
+                response_text.removeprefix("```json").removeprefix("```")
+                .removesuffix("```").strip()
             )
 
-            response_text = response.content[0].text
+        # Safety net: a single story rarely truncates at 2k tokens, but
+        # repair anything that does before giving up on the category
+        try:
+            result = parse_or_repair_json(response_text)
+        except json.JSONDecodeError as e:
+            if attempt == 1:
+                print(f"  ⚠ {category}: malformed JSON ({e}) - retrying on cached prompt")
+                continue
+            raise
+
+        stories = result.get("stories", [])
+        _story_cache_put(cache_key, stories)
+        return stories
 
-            # Clean up JSON
-            if "```" in response_text:
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-            response_text = response_text.strip()
 
-            # Attempt to repair truncated JSON
-            response_text = repair_truncated_json(response_text)
+def generate_stories_with_claude(candidates: Dict[str, List[Dict]],
+                                 on_category=None) -> List[Dict]:
+    """Use Claude to select and adapt wound care stories for categories with news.
 
-            result = json.loads(response_text)
-            stories = result.get("stories", [])
+    When `on_category` is given it's called with each category's validated
+    stories as soon as that category's call finishes, so downstream work
+    (TTS) can start while other categories are still generating.
+    """
 
-            # Validate that all stories have source URLs
-            valid_stories = []
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+
+    import anthropic
+
+    # Transport errors (429/5xx) ride the SDK's exponential backoff; the
+    # semantic retry for malformed JSON lives in _generate_category_stories
+    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=2)
+
+    # Only categories with NEW candidates get a call
+    categories_with_news = [
+        name for name in CATEGORY_NAMES
+        if candidates.get(name)
+    ]
+
+    if not categories_with_news:
+        print("  No NEW news candidates - nothing to generate")
+        return []
+
+    print(f"\n  Calling Claude API for {len(categories_with_news)} categories with new news...")
+
+    # One small call per category in parallel: each finishes faster than the
+    # old single 12k-token call, and all of them share the cached static
+    # preamble. A bad response loses one category, not the whole run.
+    stories_by_category: Dict[str, List[Dict]] = {}
+    with ThreadPoolExecutor(max_workers=len(categories_with_news)) as executor:
+        futures = {
+            executor.submit(_generate_category_stories, client, category, candidates[category]): category
+            for category in categories_with_news
+        }
+        for future in as_completed(futures):
+            category = futures[future]
+            try:
+                stories = future.result()
+            except Exception as e:
+                print(f"  ✗ {category}: generation failed - {e}")
+                continue
+
+            # Validate the full story shape, not just source_url - a story
+            # missing body_es would otherwise only surface as a TTS failure
+            valid = []
             for story in stories:
-                if story.get("source_url"):
-                    valid_stories.append(story)
-                else:
-                    print(f"  ⚠ Skipping story without source_url: {story.get('category')}")
+                try:
+                    _validate_story(story)
+                    valid.append(story)
+                except ValueError as e:
+                    print(f"  ⚠ Skipping malformed story ({story.get('category')}): {e}")
+
+            stories_by_category[category] = valid
+            if on_category and valid:
+                on_category(valid)
+
+    # Flatten in the fixed category order
+    valid_stories = [
+        story
+        for category in categories_with_news
+        for story in stories_by_category.get(category, [])
+    ]
+
+    print(f"  ✓ Generated {len(valid_stories)} valid stories")
+    return valid_stories
+
+
+async def _tts_one(client: "AsyncOpenAI", story: Dict, filepath: str, audio_url: str) -> None:
+    """Generate one story's MP3 and set its audio_url (empty on failure)."""
+    category = story.get("category", "unknown")
+
+    # Content-addressed cache check: same text, voice, model and
+    # instructions means byte-identical audio
+    key = hashlib.sha256(
+        f"{TTS_MODEL}|{TTS_VOICE}|{TTS_INSTRUCTIONS}|{story['body_es']}".encode()
+    ).hexdigest()
+    cache_path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+
+    if os.path.exists(cache_path):
+        shutil.copy(cache_path, filepath)
+        story["audio_url"] = audio_url
+        print(f"    ✓ {category}: {os.path.basename(filepath)} (cached)")
+        return
 
-            print(f"  ✓ Generated {len(valid_stories)} valid stories")
-            return valid_stories
+    try:
+        # Generate TTS for the Spanish body text with clear medical
+        # pronunciation, streaming the HTTP body straight to disk in 64KB
+        # chunks instead of buffering the whole MP3 in memory first
+        async with client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=story["body_es"],
+            instructions=TTS_INSTRUCTIONS
+        ) as response:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                async for chunk in response.iter_bytes(65536):
+                    os.write(fd, chunk)
+            finally:
+                os.close(fd)
+
+        # Store in the cache for future identical bodies; failure to cache
+        # never fails the synthesis
+        try:
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            shutil.copy(filepath, cache_path)
+        except OSError:
+            pass
 
-        except json.JSONDecodeError as e:
-            if attempt < max_retries - 1:
-                print(f"  ⚠ JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
-                print("  Retrying...")
-                import time
-                time.sleep(2)  # Brief pause before retry
-            else:
-                print(f"  ❌ JSON parse failed after {max_retries} attempts: {e}")
-                raise
+        # Update story with audio URL
+        story["audio_url"] = audio_url
+        print(f"    ✓ {category}: {os.path.basename(filepath)}")
 
+    except Exception as e:
+        print(f"    ✗ {category}: TTS error - {e}")
+        story["audio_url"] = ""
 
-def generate_tts_audio(stories: List[Dict], date_str: str) -> List[Dict]:
-    """Generate TTS audio for each story using OpenAI TTS API."""
 
-    if not OPENAI_API_KEY:
-        print("  ⚠ OPENAI_API_KEY not set - skipping TTS generation")
-        return stories
+# Curated evergreen stories, keyed by category - optional; runs without the
+# file behave exactly as before
+EVERGREEN_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evergreen_wound_stories.json')
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
 
-    # Create date-specific audio directory
-    audio_date_dir = os.path.join(AUDIO_DIR, date_str)
-    Path(audio_date_dir).mkdir(parents=True, exist_ok=True)
+def _evergreen_fallback_stories(candidates: Dict[str, List[Dict]],
+                                new_stories: List[Dict],
+                                existing_urls: Set[str]) -> List[Dict]:
+    """Pick curated evergreen stories for categories whose feeds came up empty.
 
-    for story in stories:
-        category = story.get("category", "unknown")
-        slug = CATEGORY_SLUGS.get(category, "story")
-        filename = f"{slug}.mp3"
-        filepath = os.path.join(audio_date_dir, filename)
+    Each category owns one weekly rotation slot, so at most one evergreen
+    story is inserted per run, and only on a day its feed produced nothing.
+    The story's source_url goes through the same canonical dedupe as RSS
+    candidates, so a previously inserted evergreen never repeats. Costs no
+    Claude tokens - these ship exactly as curated.
+    """
+    try:
+        with open(EVERGREEN_FILE, 'rb') as f:
+            evergreen = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return []
 
+    generated = {story.get('category') for story in new_stories}
+    slot = datetime.now().toordinal() % len(CATEGORY_NAMES)
+    picks = []
+    for i, category in enumerate(CATEGORY_NAMES):
+        if i != slot or candidates.get(category) or category in generated:
+            continue
+        story = evergreen.get(category)
+        if not story:
+            continue
+        url = story.get('source_url', '')
+        if not url or _canonical(url) in existing_urls:
+            continue
         try:
-            # Generate TTS for the Spanish body text with clear medical pronunciation
-            response = client.audio.speech.create(
-                model="gpt-4o-mini-tts-2025-12-15",
-                voice="coral",
-                input=story["body_es"],
-                instructions="Speak with a clear, professional Mexican Spanish accent. Pronounce medical terminology clearly and at a moderate pace suitable for Spanish language learners in healthcare settings. Warm but professional tone."
-            )
+            _validate_story(story)
+        except ValueError as e:
+            print(f"  ⚠ Skipping malformed evergreen story ({category}): {e}")
+            continue
+        print(f"  + {category}: inserting evergreen story (no feed news)")
+        picks.append(dict(story))
+    return picks
 
-            # Save the audio file
-            response.stream_to_file(filepath)
 
-            # Update story with audio URL
-            story["audio_url"] = f"{GITHUB_RAW_BASE}/audio/wound-care-stories/{date_str}/{filename}"
-            print(f"    ✓ {category}: {filename}")
+# At most this many synthesis requests in flight at once, however many
+# stories a run produces - mirrors the six-category fan-out
+_TTS_CONCURRENCY = 6
+
+
+async def _tts_all(client: "AsyncOpenAI", stories: List[Dict], audio_date_dir: Path, date_str: str) -> None:
+    """Synthesize all stories concurrently on one event loop."""
+    semaphore = asyncio.Semaphore(_TTS_CONCURRENCY)
+
+    # Build every story's filepath and public URL up front with local
+    # bindings - one tight loop here instead of slug/join/base lookups
+    # repeated inside each request coroutine. Paths drop to str at the
+    # os.open boundary in _tts_one.
+    _slugs = CATEGORY_SLUGS
+    url_prefix = f"{GITHUB_RAW_BASE}/audio/wound-care-stories/{date_str}"
+    jobs = []
+    for story in stories:
+        filename = f"{_slugs.get(story.get('category', ''), 'story')}.mp3"
+        jobs.append((story, str(audio_date_dir / filename), f"{url_prefix}/{filename}"))
+
+    async def _bounded(story: Dict, filepath: str, audio_url: str) -> None:
+        async with semaphore:
+            await _tts_one(client, story, filepath, audio_url)
+
+    await asyncio.gather(*[_bounded(*job) for job in jobs])
+
+
+# Shared event loop + AsyncOpenAI client, created on first use. TTS now runs
+# in per-category batches (pipelined with generation), and asyncio.run would
+# tear down the loop - and with it the httpx connection pool - after every
+# batch. Keeping one loop alive lets later batches reuse the TLS connections
+# the first one opened. Batches are serialized on one worker thread, so the
+# loop is only ever driven from a single thread.
+_TTS_LOOP = None
+_TTS_CLIENT = None
 
-        except Exception as e:
-            print(f"    ✗ {category}: TTS error - {e}")
-            story["audio_url"] = ""
+
+def _get_tts_client():
+    """Return the lazily created (event loop, AsyncOpenAI client) pair."""
+    global _TTS_LOOP, _TTS_CLIENT
+    if _TTS_CLIENT is None:
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        _TTS_LOOP = asyncio.new_event_loop()
+        # Async client multiplexes all the synthesis requests over a small
+        # pool of kept-alive connections instead of one socket each
+        _TTS_CLIENT = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_keepalive_connections=10)
+            ),
+        )
+    return _TTS_LOOP, _TTS_CLIENT
+
+
+def generate_tts_audio(stories: List[Dict], date_str: str) -> List[Dict]:
+    """Generate TTS audio for each story using OpenAI TTS API."""
+
+    if not OPENAI_API_KEY:
+        print("  ⚠ OPENAI_API_KEY not set - skipping TTS generation")
+        return stories
+
+    loop, client = _get_tts_client()
+
+    # Create date-specific audio directory once, before any worker runs
+    audio_date_dir = Path(AUDIO_DIR) / date_str
+    audio_date_dir.mkdir(parents=True, exist_ok=True)
+
+    # Each story is an independent OpenAI round-trip; _tts_one catches its
+    # own errors so one failure doesn't abort the rest
+    loop.run_until_complete(_tts_all(client, stories, audio_date_dir, date_str))
 
     return stories
 
@@ -419,9 +922,9 @@ def generate_wound_care_stories():
     print("WOUND CARE STORIES GENERATOR (ACCUMULATIVE MODE)")
     print("=" * 60)
 
-    # 1. Load existing stories for deduplication
-    print("\n[1/5] Loading existing stories...")
-    existing_stories, existing_urls = load_existing_stories()
+    # 1. Load existing story URLs for deduplication
+    print("\n[1/5] Loading existing story URLs...")
+    existing_urls = load_existing_urls()
 
     # 2. Fetch RSS candidates (only new URLs)
     print("\n[2/5] Fetching wound care news candidates (7-day window)...")
@@ -438,9 +941,33 @@ def generate_wound_care_stories():
         print("=" * 60)
         return
 
-    # 3. Generate stories with Claude (only for new news)
-    print("\n[3/5] Generating stories with Claude...")
-    new_stories = generate_stories_with_claude(candidates)
+    # 3. Generate stories with Claude (only for new news), starting each
+    # category's TTS as soon as its stories validate so synthesis overlaps
+    # with the categories still generating
+    today = datetime.now()
+    date_str = today.strftime("%Y-%m-%d")
+    print("\n[3/5] Generating stories with Claude (TTS pipelined)...")
+
+    tts_futures = []
+    with ThreadPoolExecutor(max_workers=1) as tts_executor:
+        new_stories = generate_stories_with_claude(
+            candidates,
+            on_category=lambda stories: tts_futures.append(
+                tts_executor.submit(generate_tts_audio, stories, date_str)
+            ),
+        )
+
+        # Rotate in a curated evergreen story for an empty-feed category -
+        # ships as written, no Claude call
+        evergreen = _evergreen_fallback_stories(candidates, new_stories, existing_urls)
+        if evergreen:
+            new_stories.extend(evergreen)
+            tts_futures.append(tts_executor.submit(generate_tts_audio, evergreen, date_str))
+
+        # 4. Wait for the pipelined TTS batches (audio_url is set in place)
+        print("\n[4/5] Waiting for TTS audio...")
+        for future in tts_futures:
+            future.result()
 
     if not new_stories:
         print("\n  ℹ No new stories generated")
@@ -453,21 +980,19 @@ def generate_wound_care_stories():
     for story in new_stories:
         print(f"    + {story['category']} ({story['difficulty']}): {story['headline_es'][:40]}...")
 
-    # 4. Generate TTS audio for new stories only
-    today = datetime.now()
-    date_str = today.strftime("%Y-%m-%d")
-    print("\n[4/5] Generating TTS audio for new stories...")
-    new_stories = generate_tts_audio(new_stories, date_str)
-
     # 5. Merge and save to JSON
     print("\n[5/5] Merging and saving to wound-care-stories-index.json...")
 
-    # Add timestamp to new stories
+    # Stamp ids and timestamps locally - deterministic, and one less thing
+    # for Claude to get wrong in the generated JSON
+    added_at = today.isoformat() + "Z"
     for story in new_stories:
-        story["added_at"] = today.isoformat() + "Z"
+        story["added_at"] = added_at
+        story["id"] = f"{CATEGORY_SLUGS.get(story['category'], 'story')}-{today:%Y%m%d}"
 
-    # Combine: new stories first (most recent), then existing
-    all_stories = new_stories + existing_stories
+    # Combine: new stories first (most recent), then existing. The full
+    # history is only loaded here, once we know there's something to merge.
+    all_stories = new_stories + load_full_existing()
 
     output = {
         "date": today.strftime("%Y-%m-%d"),
@@ -481,8 +1006,20 @@ def generate_wound_care_stories():
         "generated_by": "GitHub Actions + Anthropic API (accumulative mode)"
     }
 
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # Append-only log first: O(new stories) per run regardless of history
+    # size. Seed it with the full history the first time it's created.
+    if os.path.exists(STORIES_JSONL):
+        to_log = new_stories
+    else:
+        to_log = all_stories
+    with open(STORIES_JSONL, 'ab') as f:
+        for story in to_log:
+            f.write(orjson.dumps(story) + b'\n')
+
+    # orjson emits UTF-8 natively (no ensure_ascii dance) and its indent
+    # matches the 2-space layout the file has always used
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
 
     print(f"  Saved {len(all_stories)} total stories ({len(new_stories)} new)")
     print(f"  File: {OUTPUT_FILE}")
@@ -13,19 +13,30 @@ Generates educational PDFs with:
 
 import os
 import io
+import re
+import json
+import shutil
+import hashlib
+import logging
 import requests
+from bisect import insort
+from functools import lru_cache
+from itertools import chain
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from urllib.parse import quote
 
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import StyleSheet1, ParagraphStyle
 from reportlab.lib.colors import HexColor, white, black
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY, TA_RIGHT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image, KeepTogether, HRFlowable, ListFlowable, ListItem
+    PageBreak, Image, KeepTogether, HRFlowable, ListFlowable, ListItem,
+    Flowable
 )
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -47,17 +58,48 @@ SUCCESS_GREEN = HexColor('#2E7D32')
 # ============================================================================
 # UNSPLASH IMAGE FETCHING - Keys from environment only (no hardcoding)
 # ============================================================================
+
+# Shared session: the search calls and image downloads all hit the same two
+# Unsplash hosts, so keep-alive skips a TLS handshake per request, and
+# transient 429/5xx responses get a short backed-off retry
+# The render path logs rather than prints: under the process-pool batch
+# driver, print() serializes workers on the stdout lock, and logging
+# skips formatting entirely when the level is off
+log = logging.getLogger(__name__)
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])
+))
+
+
 def get_unsplash_api_key() -> str:
     """Get Unsplash API key from environment variables."""
     return os.environ.get('UNSPLASH_ACCESS_KEY') or os.environ.get('UNSPLASH_API_KEY')
 
 
+# Per-query image cache - the categories reuse the same queries day after
+# day, so most runs skip both the Unsplash search and the ~1MB download
+UNSPLASH_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache', 'unsplash')
+
+
+def _unsplash_cache_paths(query: str, width: int, height: int):
+    """Return (image, metadata) cache paths for a query at a given size."""
+    key = hashlib.sha256(f"{query}|{width}x{height}".encode()).hexdigest()
+    return (os.path.join(UNSPLASH_CACHE_DIR, f"{key}.jpg"),
+            os.path.join(UNSPLASH_CACHE_DIR, f"{key}.json"))
+
+
 def fetch_unsplash_image(
     query: str,
     api_key: Optional[str] = None,
     output_path: str = "/tmp/unsplash_image.jpg",
     width: int = 800,
-    height: int = 450
+    height: int = 450,
+    max_bytes: int = 2_000_000
 ) -> Optional[Dict]:
     """
     Fetch an image from Unsplash API and download it.
@@ -70,6 +112,7 @@ def fetch_unsplash_image(
         output_path: Where to save the downloaded image
         width: Target width in pixels
         height: Target height in pixels
+        max_bytes: Abort the download past this size (0 disables the cap)
 
     Returns:
         Dict with image_path and attribution, or None on failure.
@@ -81,6 +124,23 @@ def fetch_unsplash_image(
     if not api_key:
         print("ERROR: No Unsplash API key. Set UNSPLASH_ACCESS_KEY environment variable.")
         return None
+
+    # Serve repeat queries from the on-disk cache
+    cached_image, cached_meta = _unsplash_cache_paths(query, width, height)
+    if os.path.exists(cached_image) and os.path.exists(cached_meta):
+        try:
+            with open(cached_meta, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            shutil.copy(cached_image, output_path)
+            return {
+                "image_path": output_path,
+                "attribution": meta["attribution"],
+                "photographer": meta["photographer"]
+            }
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass  # Corrupt cache entry - fall through and refetch
+
     try:
         # Search for images
         search_url = "https://api.unsplash.com/search/photos"
@@ -91,7 +151,7 @@ def fetch_unsplash_image(
         }
         headers = {"Authorization": f"Client-ID {api_key}"}
 
-        response = requests.get(search_url, params=params, headers=headers, timeout=15)
+        response = _SESSION.get(search_url, params=params, headers=headers, timeout=15)
         response.raise_for_status()
         data = response.json()
 
@@ -99,30 +159,56 @@ def fetch_unsplash_image(
             print(f"No images found for: {query}")
             return None
 
-        # Get first result
+        # Get first result. Ask Unsplash's CDN for the final size up front:
+        # server-side crop/resize means no multi-megapixel download and no
+        # client-side resampling. fm=jpg rather than auto=format because the
+        # bytes go straight into the PDF builder, not a browser.
         photo = data["results"][0]
-        image_url = photo["urls"]["regular"]
+        image_url = f"{photo['urls']['raw']}&w={width}&h={height}&fit=crop&fm=jpg&q=85"
         photographer = photo["user"]["name"]
 
-        # Download image
-        img_response = requests.get(image_url, timeout=30)
-        img_response.raise_for_status()
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-
-        with open(output_path, 'wb') as f:
-            f.write(img_response.content)
-
-        # Resize with Pillow if available
+        # Download image - stream straight to disk in 64KB chunks instead of
+        # buffering the whole body, and bail on unexpectedly large originals
+        # (the PDF renders at ~400px wide; a multi-MB hero image is waste)
+        with _SESSION.get(image_url, timeout=30, stream=True) as img_response:
+            img_response.raise_for_status()
+
+            # Ensure directory exists
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+            total = 0
+            with open(output_path, 'wb') as f:
+                for chunk in img_response.iter_content(chunk_size=64 * 1024):
+                    total += len(chunk)
+                    if max_bytes and total > max_bytes:
+                        raise ValueError(f"image exceeds {max_bytes} byte cap")
+                    f.write(chunk)
+
+        # Guard only: the CDN delivers the target size, so the local resize
+        # path (reduced-scale draft() decode + thumbnail()) runs solely if
+        # the returned dimensions disagree with what we asked for
         try:
             from PIL import Image as PILImage
             with PILImage.open(output_path) as img:
-                img = img.resize((width, height), PILImage.LANCZOS)
-                img.save(output_path, quality=85, optimize=True)
+                if img.size != (width, height):
+                    img.draft('RGB', (width * 2, height * 2))
+                    img.thumbnail((width, height), PILImage.LANCZOS)
+                    img.save(output_path, 'JPEG', quality=85, optimize=True, progressive=True)
         except ImportError:
             pass
 
+        # Store the final (resized) image for future runs
+        try:
+            os.makedirs(UNSPLASH_CACHE_DIR, exist_ok=True)
+            shutil.copy(output_path, cached_image)
+            with open(cached_meta, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "attribution": f"Foto: {photographer} / Unsplash",
+                    "photographer": photographer
+                }, f, ensure_ascii=False)
+        except OSError:
+            pass  # Cache write failure shouldn't fail the fetch
+
         return {
             "image_path": output_path,
             "attribution": f"Foto: {photographer} / Unsplash",
@@ -137,6 +223,139 @@ def fetch_unsplash_image(
 # ============================================================================
 # PDF BUILDER CLASS
 # ============================================================================
+
+# Spanish month names indexed by datetime.month - strftime("%B") is
+# locale-dependent, so translate ourselves instead of chaining .replace()
+_MONTHS_ES = {
+    1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
+    5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
+    9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre"
+}
+
+
+# TableStyle is an immutable command list that ReportLab happily shares
+# between tables, so build the one we use once instead of per call
+_ANSWER_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TEXTCOLOR', (0, 0), (-1, -1), DARK_GRAY),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('BACKGROUND', (0, 0), (-1, -1), LIGHT_GRAY),
+])
+
+
+# The layout deliberately sticks to ReportLab's built-in Type 1 fonts -
+# they measure and embed roughly twice as fast as TrueType. Check at
+# import that nobody has shadowed them with a TTF registration, and
+# touch the per-(font, size) width cache once so first-page layout
+# doesn't pay for cold measurements.
+_BUILTIN_FONTS = (
+    'Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique',
+    'Times-Roman', 'Times-Italic'
+)
+
+
+def _preflight_fonts():
+    sample = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    for name in _BUILTIN_FONTS:
+        font = pdfmetrics.getFont(name)  # raises KeyError if unregistered
+        if isinstance(font, TTFont):
+            raise RuntimeError(
+                f"Built-in font '{name}' was shadowed by a TrueType "
+                f"registration; the PDF builder relies on the Type 1 originals"
+            )
+        for size in (8, 9, 10, 11, 12, 14, 16, 18, 32):
+            pdfmetrics.stringWidth(sample, name, size)
+
+
+_preflight_fonts()
+
+
+# Stateless flowables shared across iterations and builds: ReportLab only
+# reads them during layout, so one instance can appear many times in a story
+_STORY_GAP = Spacer(1, 20)
+_STORY_DIVIDER = HRFlowable(width="100%", thickness=1, color=MEDIUM_GRAY, spaceAfter=20)
+_VOCAB_SPACER = Spacer(1, 8)
+
+
+class _CategoryTag(Flowable):
+    """Fixed-size colored category label.
+
+    Replaces the 1x1 Table previously used for the red tag: a Table
+    drags in row-height calculation and style-command dispatch just to
+    paint one rectangle, where this draws a rect and a centered string.
+    """
+
+    width = 1.8 * inch
+    height = 0.28 * inch
+
+    def __init__(self, text: str):
+        Flowable.__init__(self)
+        self.text = text
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        c = self.canv
+        c.setFillColor(SPANISH_RED)
+        c.rect(0, 0, self.width, self.height, fill=1, stroke=0)
+        c.setFillColor(white)
+        c.setFont('Helvetica-Bold', 9)
+        c.drawCentredString(self.width / 2, 0.09 * inch, self.text)
+
+
+def _question_number(q: Dict) -> int:
+    """Sort key for quiz questions (insertion order via bisect)."""
+    return q.get('number', 0)
+
+
+@lru_cache(maxsize=256)
+def _compile_word(word: str):
+    """Compiled word-boundary pattern for vocab highlighting, cached per word."""
+    return re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _image_bytes(path: str) -> bytes:
+    """Read an image file once per process.
+
+    Batch runs reference the same cached Unsplash files from several PDFs;
+    the Image flowable itself must be fresh per document, but the bytes
+    underneath can be shared.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=128)
+def _prepare_image(path: str) -> bytes:
+    """Image bytes downscaled to the rendered size, cached per path.
+
+    ReportLab embeds whatever resolution it is given, so a 3000px
+    original balloons the PDF even though the story box renders at
+    6x3.4 inches. Unsplash images arrive pre-sized from the CDN and
+    pass through untouched; anything larger (e.g. a hand-supplied
+    image_path) gets thumbnailed to ~150 DPI JPEG first.
+    """
+    raw = _image_bytes(path)
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return raw
+    try:
+        with PILImage.open(io.BytesIO(raw)) as im:
+            if im.width <= 900 and im.height <= 520:
+                return raw
+            im.thumbnail((900, 520), PILImage.LANCZOS)
+            buf = io.BytesIO()
+            im.convert('RGB').save(buf, 'JPEG', quality=82, optimize=True)
+            return buf.getvalue()
+    except Exception:
+        return raw
+
+
 class SpanishLearningPDF:
     """
     Builds Spanish learning PDFs with proper structure:
@@ -156,22 +375,27 @@ class SpanishLearningPDF:
     ):
         self.title = title
         self.subtitle = subtitle
-        self.date = date or datetime.now().strftime("%d de %B de %Y").replace(
-            "January", "enero").replace("February", "febrero").replace(
-            "March", "marzo").replace("April", "abril").replace(
-            "May", "mayo").replace("June", "junio").replace(
-            "July", "julio").replace("August", "agosto").replace(
-            "September", "septiembre").replace("October", "octubre").replace(
-            "November", "noviembre").replace("December", "diciembre")
+        now = datetime.now()
+        self.date = date or f"{now.day:02d} de {_MONTHS_ES[now.month]} de {now.year}"
         self.level = level
         self.stories = []
         self.vocabulary = []
         self.quiz_questions = []
         self.styles = self._create_styles()
 
-    def _create_styles(self) -> dict:
-        """Create all paragraph styles."""
-        styles = getSampleStyleSheet()
+    # Shared across instances: the ~16 ParagraphStyles are read-only
+    # constants, so batch runs build the stylesheet once, not per PDF
+    _STYLES = None
+
+    @classmethod
+    def _create_styles(cls) -> dict:
+        """Create all paragraph styles (memoized at class level)."""
+        if cls._STYLES is not None:
+            return cls._STYLES
+
+        # Start from an empty sheet: the sample sheet's Normal/Heading/Code
+        # etc. styles were never referenced, only the ones added below are
+        styles = StyleSheet1()
 
         styles.add(ParagraphStyle(
             name='MainTitle',
@@ -250,29 +474,15 @@ class SpanishLearningPDF:
             rightIndent=10
         ))
 
+        # One style for the whole vocab entry; the context/word/definition
+        # looks are carried by inline <font> markup so each entry is a
+        # single Paragraph instead of three
         styles.add(ParagraphStyle(
-            name='VocabContext',
-            fontName='Times-Italic',
-            fontSize=11,
-            textColor=DARK_GRAY,
-            leading=14
-        ))
-
-        styles.add(ParagraphStyle(
-            name='VocabWord',
-            fontName='Helvetica-Bold',
-            fontSize=12,
-            textColor=ACCENT_BLUE,
-            leading=16
-        ))
-
-        styles.add(ParagraphStyle(
-            name='VocabDef',
+            name='VocabEntry',
             fontName='Times-Roman',
-            fontSize=10,
+            fontSize=11,
             textColor=DARK_GRAY,
-            leading=13,
-            leftIndent=15
+            leading=15
         ))
 
         styles.add(ParagraphStyle(
@@ -311,14 +521,7 @@ class SpanishLearningPDF:
             spaceAfter=8
         ))
 
-        styles.add(ParagraphStyle(
-            name='CategoryTag',
-            fontName='Helvetica-Bold',
-            fontSize=9,
-            textColor=white,
-            alignment=TA_CENTER
-        ))
-
+        cls._STYLES = styles
         return styles
 
     def add_vocabulary(self, vocab_list: List[Dict]):
@@ -328,188 +531,233 @@ class SpanishLearningPDF:
         self.stories.append(story)
 
     def add_quiz_question(self, question: Dict):
-        self.quiz_questions.append(question)
-
-    def _build_header(self) -> List:
-        elements = []
-        elements.append(HRFlowable(width="100%", thickness=8, color=SPANISH_RED, spaceAfter=25))
-        elements.append(Paragraph(self.title, self.styles['MainTitle']))
-        elements.append(Paragraph(self.subtitle, self.styles['Subtitle']))
-        elements.append(Paragraph(f"{self.date} | Nivel {self.level}", self.styles['DateLine']))
-        elements.append(HRFlowable(width="30%", thickness=4, color=SPANISH_YELLOW, spaceAfter=20))
-        return elements
-
-    def _build_vocabulary_section(self) -> List:
-        elements = []
-        elements.append(Paragraph("📚 VOCABULARIO PREPARATORIO", self.styles['SectionHeader']))
-        elements.append(Paragraph("<i>Estudia estas palabras antes de leer las noticias.</i>", self.styles['BodyEnglish']))
-        elements.append(Spacer(1, 10))
-
+        # Keep the list ordered by question number on insert so the quiz
+        # and answer-key builders can walk it without re-sorting
+        insort(self.quiz_questions, question, key=_question_number)
+
+    # The _build_* methods are generators: save() chains them straight into
+    # the final flowable list, so no per-section intermediate lists are built
+
+    def _build_header(self):
+        yield HRFlowable(width="100%", thickness=8, color=SPANISH_RED, spaceAfter=25)
+        yield Paragraph(self.title, self.styles['MainTitle'])
+        yield Paragraph(self.subtitle, self.styles['Subtitle'])
+        yield Paragraph(f"{self.date} | Nivel {self.level}", self.styles['DateLine'])
+        yield HRFlowable(width="30%", thickness=4, color=SPANISH_YELLOW, spaceAfter=20)
+
+    def _build_vocabulary_section(self):
+        styles = self.styles
+        yield Paragraph("📚 VOCABULARIO PREPARATORIO", styles['SectionHeader'])
+        yield Paragraph("<i>Estudia estas palabras antes de leer las noticias.</i>", styles['BodyEnglish'])
+        yield Spacer(1, 10)
+
+        vocab_entry = styles['VocabEntry']
         for i, vocab in enumerate(self.vocabulary, 1):
             context = vocab.get('context', '')
             word = vocab.get('word', '')
 
-            if word and context:
-                context_highlighted = context.replace(word, f"<b><font color='#1E5AA8'>{word}</font></b>")
-                context_highlighted = context_highlighted.replace(word.capitalize(), f"<b><font color='#1E5AA8'>{word.capitalize()}</font></b>")
+            # Cheap substring check first - C-level str.find beats firing
+            # up the regex engine when the word isn't in its context at
+            # all (anchors, morphological variants)
+            if word and context and word.lower() in context.lower():
+                # One case-insensitive, word-boundary pass; keeps the
+                # original casing and can't double-wrap like the old
+                # back-to-back .replace() calls could
+                context_highlighted = _compile_word(word).sub(
+                    lambda m: f"<b><font color='#1E5AA8'>{m.group(0)}</font></b>", context)
             else:
                 context_highlighted = context
 
-            elements.append(Paragraph(f"<i>\"{context_highlighted}\"</i>", self.styles['VocabContext']))
             syllables = vocab.get('syllables', word.upper())
             pos = vocab.get('pos', '')
-            elements.append(Paragraph(f"<b>{i}. {word}</b> [{syllables}] <i>({pos})</i>", self.styles['VocabWord']))
             def_es = vocab.get('definition_es', '')
             def_en = vocab.get('definition_en', '')
-            elements.append(Paragraph(f"→ {def_es}<br/><i>English: {def_en}</i>", self.styles['VocabDef']))
-            elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_category_tag(self, category: str) -> Table:
-        tag = Table([[Paragraph(category.upper(), self.styles['CategoryTag'])]], colWidths=[1.8*inch])
-        tag.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), SPANISH_RED),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 5),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        return tag
-
-    def _build_story_section(self, story: Dict, story_num: int) -> List:
-        elements = []
-        elements.append(self._build_category_tag(story.get('category', 'Noticias')))
-        elements.append(Spacer(1, 8))
-        elements.append(Paragraph(f"Historia {story_num}: {story.get('headline_es', '')}", self.styles['StoryHeadline']))
-        elements.append(Paragraph(story.get('headline_en', ''), self.styles['StoryHeadlineEn']))
+            # One Paragraph per entry: a third of the flowables, and one
+            # markup-parse pass instead of three
+            yield Paragraph(
+                f"<i>\"{context_highlighted}\"</i><br/>"
+                f"<font face='Helvetica-Bold' size='12' color='#1E5AA8'>{i}. {word}</font>"
+                f" [{syllables}] <i>({pos})</i><br/>"
+                f"→ {def_es}<br/><i>English: {def_en}</i>",
+                vocab_entry
+            )
+            yield _VOCAB_SPACER
+
+    def _build_category_tag(self, category: str) -> Flowable:
+        return _CategoryTag(category.upper())
+
+    def _build_story_section(self, story: Dict, story_num: int):
+        styles = self.styles
+        yield self._build_category_tag(story.get('category', 'Noticias'))
+        yield Spacer(1, 8)
+        yield Paragraph(f"Historia {story_num}: {story.get('headline_es', '')}", styles['StoryHeadline'])
+        yield Paragraph(story.get('headline_en', ''), styles['StoryHeadlineEn'])
 
         image_path = story.get('image_path')
         if image_path and os.path.exists(image_path):
             try:
-                img = Image(image_path, width=6*inch, height=3.4*inch)
-                elements.append(img)
+                img = Image(io.BytesIO(_prepare_image(image_path)), width=6*inch, height=3.4*inch)
+            except Exception:
+                log.exception("image load failed: %s", image_path)
+            else:
+                yield img
                 attribution = story.get('image_attribution', '')
                 if attribution:
-                    elements.append(Paragraph(attribution, self.styles['Attribution']))
-            except Exception as e:
-                print(f"Error loading image: {e}")
+                    yield Paragraph(attribution, styles['Attribution'])
 
-        elements.append(Spacer(1, 8))
-        elements.append(Paragraph(story.get('body_es', ''), self.styles['BodySpanish']))
-        elements.append(Paragraph(f"<b>Traducción:</b> {story.get('body_en', '')}", self.styles['BodyEnglish']))
+        yield Spacer(1, 8)
+        yield Paragraph(story.get('body_es', ''), styles['BodySpanish'])
+        yield Paragraph(f"<b>Traducción:</b> {story.get('body_en', '')}", styles['BodyEnglish'])
 
         source = story.get('source', '')
         if source:
-            elements.append(Paragraph(f"<i>Fuente: {source}</i>", self.styles['Attribution']))
-
-        return elements
+            yield Paragraph(f"<i>Fuente: {source}</i>", styles['Attribution'])
 
-    def _build_quiz_section(self) -> List:
-        elements = []
-        elements.append(Paragraph("📝 PRUEBA DE COMPRENSIÓN", self.styles['SectionHeader']))
-        elements.append(Paragraph("<i>Responde las siguientes preguntas basándote en las noticias.</i>", self.styles['BodyEnglish']))
-        elements.append(Spacer(1, 10))
+    def _build_quiz_section(self):
+        styles = self.styles
+        yield Paragraph("📝 PRUEBA DE COMPRENSIÓN", styles['SectionHeader'])
+        yield Paragraph("<i>Responde las siguientes preguntas basándote en las noticias.</i>", styles['BodyEnglish'])
+        yield Spacer(1, 10)
 
-        elements.append(Paragraph("<b>Vocabulario (1-4)</b>", self.styles['QuizQuestion']))
-        elements.append(Spacer(1, 5))
+        # Single partition pass; previously a question tagged vocab with a
+        # number above 4 matched both filters and printed twice
+        vocab_qs, comp_qs = [], []
         for q in self.quiz_questions:
             if q.get('type') == 'vocab' or q.get('number', 0) <= 4:
-                elements.extend(self._format_question(q))
+                vocab_qs.append(q)
+            else:
+                comp_qs.append(q)
 
-        elements.append(Spacer(1, 15))
-        elements.append(Paragraph("<b>Comprensión (5-10)</b>", self.styles['QuizQuestion']))
-        elements.append(Spacer(1, 5))
-        for q in self.quiz_questions:
-            if q.get('type') == 'comprehension' or q.get('number', 0) > 4:
-                elements.extend(self._format_question(q))
+        yield Paragraph("<b>Vocabulario (1-4)</b>", styles['QuizQuestion'])
+        yield Spacer(1, 5)
+        for q in vocab_qs:
+            yield from self._format_question(q)
 
-        return elements
+        yield Spacer(1, 15)
+        yield Paragraph("<b>Comprensión (5-10)</b>", styles['QuizQuestion'])
+        yield Spacer(1, 5)
+        for q in comp_qs:
+            yield from self._format_question(q)
 
-    def _format_question(self, q: Dict) -> List:
-        elements = []
+    def _format_question(self, q: Dict):
         num = q.get('number', '?')
         question = q.get('question_es', '')
         options = q.get('options', [])
 
-        elements.append(Paragraph(f"<b>{num}.</b> {question}", self.styles['QuizQuestion']))
+        styles = self.styles
+        yield Paragraph(f"<b>{num}.</b> {question}", styles['QuizQuestion'])
         if options:
+            quiz_option = styles['QuizOption']
             for i, opt in enumerate(options):
                 letter = chr(97 + i)
-                elements.append(Paragraph(f"{letter}) {opt}", self.styles['QuizOption']))
-        elements.append(Spacer(1, 8))
-        return elements
+                yield Paragraph(f"{letter}) {opt}", quiz_option)
+        yield Spacer(1, 8)
 
-    def _build_answer_key(self) -> List:
-        elements = []
-        elements.append(Paragraph("✅ RESPUESTAS", self.styles['SectionHeader']))
-        elements.append(Spacer(1, 10))
+    def _build_answer_key(self):
+        yield Paragraph("✅ RESPUESTAS", self.styles['SectionHeader'])
+        yield Spacer(1, 10)
 
         answers = []
-        for q in sorted(self.quiz_questions, key=lambda x: x.get('number', 0)):
+        for q in self.quiz_questions:
             num = q.get('number', '?')
             ans = q.get('answer', '?')
             if isinstance(ans, bool):
                 ans = "Verdadero" if ans else "Falso"
             answers.append(f"{num}. {ans}")
 
+        # mid is ceil(n/2), so the right column is short by at most one
+        # cell - pad arithmetically rather than looping
         mid = (len(answers) + 1) // 2
-        col1 = answers[:mid]
         col2 = answers[mid:]
-        while len(col2) < len(col1):
-            col2.append("")
-
-        answer_data = list(zip(col1, col2))
-        answer_table = Table(answer_data, colWidths=[2.5*inch, 2.5*inch])
-        answer_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (-1, -1), DARK_GRAY),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (-1, -1), LIGHT_GRAY),
-        ]))
-        elements.append(answer_table)
-        return elements
+        col2 += [""] * (mid - len(col2))
+
+        answer_data = list(zip(answers[:mid], col2))
+        # Fixed row height (11pt text + 4pt padding top and bottom) saves
+        # ReportLab measuring every cell to size the rows itself
+        answer_table = Table(answer_data, colWidths=[2.5*inch, 2.5*inch],
+                             rowHeights=[0.22*inch] * len(answer_data))
+        answer_table.setStyle(_ANSWER_TABLE_STYLE)
+        yield answer_table
 
     def save(self, output_path: str):
         os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
-
-        elements = []
-        elements.extend(self._build_header())
-
-        if self.vocabulary:
-            elements.extend(self._build_vocabulary_section())
-            elements.append(PageBreak())
-
-        for i, story in enumerate(self.stories, 1):
-            elements.extend(self._build_story_section(story, i))
-            if i < len(self.stories):
-                elements.append(Spacer(1, 20))
-                elements.append(HRFlowable(width="100%", thickness=1, color=MEDIUM_GRAY, spaceAfter=20))
-
-        if self.quiz_questions:
-            elements.append(PageBreak())
-            elements.extend(self._build_quiz_section())
-
-        if self.quiz_questions:
-            elements.append(PageBreak())
-            elements.extend(self._build_answer_key())
-
-        doc.build(elements)
-        print(f"PDF saved: {output_path}")
+        # Hand ReportLab a generously buffered file object instead of a
+        # path: its canvas emits many small writes, and a 1MB buffer
+        # collapses them into a handful of syscalls
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            doc = SimpleDocTemplate(
+                f,
+                pagesize=letter,
+                rightMargin=0.75*inch,
+                leftMargin=0.75*inch,
+                topMargin=0.75*inch,
+                bottomMargin=0.75*inch
+            )
+
+            # Chain the section generators into the one list ReportLab needs -
+            # no intermediate per-section lists are materialized along the way
+            sections = [self._build_header()]
+
+            if self.vocabulary:
+                sections.append(self._build_vocabulary_section())
+                sections.append((PageBreak(),))
+
+            last = len(self.stories)
+            for i, story in enumerate(self.stories, 1):
+                sections.append(self._build_story_section(story, i))
+                if i < last:
+                    sections.append((_STORY_GAP, _STORY_DIVIDER))
+
+            if self.quiz_questions:
+                sections.append((PageBreak(),))
+                sections.append(self._build_quiz_section())
+                sections.append((PageBreak(),))
+                sections.append(self._build_answer_key())
+
+            doc.build(list(chain.from_iterable(sections)))
+        log.info("PDF saved: %s", output_path)
         return output_path
 
 
+# ============================================================================
+# BATCH RENDERING - PDF layout is CPU-bound and stateless per document,
+# so multiple PDFs can be rendered in parallel worker processes
+# ============================================================================
+
+def render_pdf(payload: Dict) -> str:
+    """Build one PDF from a plain-dict payload.
+
+    Module-level (and dict-in, path-out) so it is picklable for worker
+    processes. Expected keys: output_path (required), plus optional
+    title, subtitle, date, level, vocabulary, stories, quiz_questions.
+    """
+    pdf = SpanishLearningPDF(
+        title=payload.get('title', "Español con Noticias"),
+        subtitle=payload.get('subtitle', "Noticias de Estados Unidos"),
+        date=payload.get('date'),
+        level=payload.get('level', "A2-B1")
+    )
+    pdf.add_vocabulary(payload.get('vocabulary', []))
+    for story in payload.get('stories', []):
+        pdf.add_story(story)
+    for question in payload.get('quiz_questions', []):
+        pdf.add_quiz_question(question)
+    return pdf.save(payload['output_path'])
+
+
+def render_pdfs(payloads: List[Dict], max_workers: int = None) -> List[str]:
+    """Render several PDFs concurrently, one worker process per core.
+
+    ReportLab's layout loops hold the GIL, so threads don't help here;
+    separate processes scale with core count. A single payload (the
+    common daily case) is rendered inline to skip the pool spin-up.
+    """
+    if len(payloads) <= 1:
+        return [render_pdf(p) for p in payloads]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(render_pdf, payloads))
+
+
 if __name__ == "__main__":
     print("SpanishLearningPDF module loaded. Import and use SpanishLearningPDF class.")